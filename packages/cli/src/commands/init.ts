@@ -5,6 +5,21 @@ import chalk from "chalk";
 import type { Command } from "commander";
 import { captureError, captureInitEvent } from "../utils/analytics";
 
+// Ordered by lock-file precedence; the first match wins, npm is the fallback.
+const PACKAGE_MANAGERS = [
+  {
+    lockFile: "pnpm-lock.yaml",
+    name: "pnpm",
+    installCommand: "pnpm add @voltagent/cli --save-dev",
+  },
+  { lockFile: "yarn.lock", name: "yarn", installCommand: "yarn add @voltagent/cli --dev" },
+  {
+    lockFile: "package-lock.json",
+    name: "npm",
+    installCommand: "npm install @voltagent/cli --save-dev",
+  },
+] as const;
+
 export const registerInitCommand = (program: Command): void => {
   program
     .command("init")
@@ -31,18 +46,15 @@ export const registerInitCommand = (program: Command): void => {
         const scripts = packageJson.scripts || {};
 
         // Detect package manager
-        let packageManager = "npm";
+        let detectedManager = PACKAGE_MANAGERS[PACKAGE_MANAGERS.length - 1];
         try {
-          // Check if pnpm is being used
-          if (fs.existsSync(path.join(process.cwd(), "pnpm-lock.yaml"))) {
-            packageManager = "pnpm";
-          } else if (fs.existsSync(path.join(process.cwd(), "yarn.lock"))) {
-            packageManager = "yarn";
-          }
+          detectedManager =
+            PACKAGE_MANAGERS.find((pm) => fs.existsSync(path.join(process.cwd(), pm.lockFile))) ??
+            detectedManager;
         } catch {
           // Default to npm if detection fails
-          packageManager = "npm";
         }
+        const packageManager = detectedManager.name;
 
         console.log(chalk.blue(`Detected package manager: ${packageManager}`));
 
@@ -79,14 +91,7 @@ export const registerInitCommand = (program: Command): void => {
         if (!isPackageInstalled) {
           console.log(chalk.cyan("Installing @voltagent/cli locally..."));
           try {
-            const installCommand =
-              packageManager === "yarn"
-                ? "yarn add @voltagent/cli --dev"
-                : packageManager === "pnpm"
-                  ? "pnpm add @voltagent/cli --save-dev"
-                  : "npm install @voltagent/cli --save-dev";
-
-            execSync(installCommand, { stdio: "inherit" });
+            execSync(detectedManager.installCommand, { stdio: "inherit" });
             console.log(chalk.green("✓ @voltagent/cli successfully installed!"));
           } catch (error) {
             console.error(
@@ -87,12 +87,14 @@ export const registerLoginCommand = (program: Command) => {
 
         const startTime = Date.now();
         const expiresAt = startTime + deviceCode.expires_in * 1000;
+        // Poll immediately, then wait the server-provided interval between
+        // attempts (growing it when the server asks us to slow down) so a fast
+        // authorization doesn't pay a full interval of latency up front.
+        let pollIntervalMs = deviceCode.interval * 1000;
         let authorized = false;
         let accessToken = "";
 
         while (Date.now() < expiresAt && !authorized) {
-          await new Promise((resolve) => setTimeout(resolve, deviceCode.interval * 1000));
-
           try {
             const tokenResponse = await fetch(`${API_BASE_URL}/auth/cli/token`, {
               method: "POST",
@@ -108,6 +110,13 @@ export const registerLoginCommand = (program: Command) => {
 
             if (tokenData.error === "authorization_pending") {
               // Still waiting
+              await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+              continue;
+            }
+
+            if (tokenData.error === "slow_down") {
+              pollIntervalMs += 5000;
+              await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
               continue;
             }
 
@@ -126,8 +135,13 @@ export const registerLoginCommand = (program: Command) => {
               authorized = true;
               break;
             }
+
+            // Unexpected response shape (no error, no token); wait the normal
+            // interval instead of hammering the endpoint in a tight loop
+            await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
           } catch (_error) {
             // Network error, continue polling
+            await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
           }
         }
 
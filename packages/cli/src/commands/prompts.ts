@@ -562,7 +562,7 @@ const fetchPromptExport = async (auth: AuthConfig, promptNames?: string[]): Prom
 const writeZipExport = async (outputDir: string, buffer: Buffer): Promise<number> => {
   const zip = new AdmZip(buffer);
   const entries = zip.getEntries();
-  let fileCount = 0;
+  const writeTasks: Promise<void>[] = [];
 
   for (const entry of entries) {
     if (entry.isDirectory) {
@@ -581,12 +581,16 @@ const writeZipExport = async (outputDir: string, buffer: Buffer): Promise<number
       continue;
     }
 
-    await fsExtra.ensureDir(path.dirname(resolvedPath));
-    await fsExtra.writeFile(resolvedPath, entry.getData());
-    fileCount++;
+    // Entries resolve to distinct paths, so the writes can overlap
+    writeTasks.push(
+      fsExtra
+        .ensureDir(path.dirname(resolvedPath))
+        .then(() => fsExtra.writeFile(resolvedPath, entry.getData())),
+    );
   }
 
-  return fileCount;
+  await Promise.all(writeTasks);
+  return writeTasks.length;
 };
 
 const writeTextExport = async (
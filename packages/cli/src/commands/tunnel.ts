@@ -1,6 +1,6 @@
+import { Socket } from "node:net";
 import chalk from "chalk";
 import type { Command } from "commander";
-import localtunnel from "localtunnel";
 import ora from "ora";
 import { captureError, captureTunnelEvent } from "../utils/analytics";
 import {
@@ -10,6 +10,13 @@ import {
   readVoltOpsToken,
 } from "../utils/config";
 
+// Deferred so the tunnel client only loads when the tunnel command runs,
+// instead of on every CLI invocation
+const loadLocaltunnel = async (): Promise<(typeof import("localtunnel"))["default"]> => {
+  const localtunnelPackage = await import("localtunnel");
+  return localtunnelPackage.default;
+};
+
 const API_BASE_URL = "https://api.voltagent.dev";
 const TUNNEL_HOST = "https://tunnel.voltagent.dev";
 
@@ -19,6 +26,25 @@ interface SubdomainResponse {
   planName: string;
 }
 
+/**
+ * Cheap TCP pre-ping with a short timeout to see if a local server is up
+ */
+function isLocalPortReachable(port: number, timeoutMs = 1000): Promise<boolean> {
+  return new Promise((resolve) => {
+    const socket = new Socket();
+    const finish = (reachable: boolean) => {
+      socket.destroy();
+      resolve(reachable);
+    };
+
+    socket.setTimeout(timeoutMs);
+    socket.once("connect", () => finish(true));
+    socket.once("timeout", () => finish(false));
+    socket.once("error", () => finish(false));
+    socket.connect(port, "127.0.0.1");
+  });
+}
+
 function validatePrefix(prefix: string): boolean {
   // Alphanumeric and dash, 1-20 characters, must start with letter or number
   const regex = /^[a-z0-9][a-z0-9-]{0,19}$/;
@@ -65,6 +91,15 @@ export const registerTunnelCommand = (program: Command) => {
         }
       }
 
+      // Warn up front when nothing is listening locally, before spending
+      // network round-trips on subscription checks and tunnel registration
+      if (!(await isLocalPortReachable(port))) {
+        console.log(chalk.yellow(`\n⚠ Nothing is listening on http://localhost:${port} yet`));
+        console.log(
+          chalk.gray("The tunnel will still open; start your VoltAgent server to serve requests."),
+        );
+      }
+
       try {
         // Check for login token
         const token = readVoltOpsToken();
@@ -77,6 +112,7 @@ export const registerTunnelCommand = (program: Command) => {
 
           const spinner = ora("Opening tunnel...").start();
 
+          const localtunnel = await loadLocaltunnel();
           const tunnel = await localtunnel({
             port,
             host: TUNNEL_HOST,
@@ -136,6 +172,7 @@ export const registerTunnelCommand = (program: Command) => {
 
             const tunnelSpinner = ora("Opening tunnel...").start();
 
+            const localtunnel = await loadLocaltunnel();
             const tunnel = await localtunnel({
               port,
               host: TUNNEL_HOST,
@@ -176,6 +213,7 @@ export const registerTunnelCommand = (program: Command) => {
 
           const tunnelSpinner = ora("Opening persistent tunnel...").start();
 
+          const localtunnel = await loadLocaltunnel();
           const tunnel = await localtunnel({
             port,
             host: TUNNEL_HOST,
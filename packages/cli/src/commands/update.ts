@@ -4,10 +4,16 @@ import path from "node:path";
 import chalk from "chalk";
 import type { Command } from "commander";
 import inquirer from "inquirer";
-import * as ncuPackage from "npm-check-updates";
 import ora from "ora";
 import { captureError, captureUpdateEvent } from "../utils/analytics";
 
+// npm-check-updates pulls in the npm registry stack; load it on demand so
+// unrelated CLI commands don't pay its import cost at startup
+const loadNcu = async (): Promise<(typeof import("npm-check-updates"))["default"]> => {
+  const ncuPackage = await import("npm-check-updates");
+  return ncuPackage.default;
+};
+
 // Not directly importing from @voltagent/core due to potential circular dependencies
 // instead, we'll implement a simpler version here
 type UpdateResult = {
@@ -66,8 +72,34 @@ const checkForUpdates = async (
       };
     }
 
+    // The registry check costs a network round trip per dependency; when the
+    // filter is a simple prefix glob and nothing in package.json matches it,
+    // the answer cannot change, so skip the check entirely.
+    const filter = options?.filter;
+    if (filter?.endsWith("*") && !filter.includes("/")) {
+      const prefix = filter.slice(0, -1);
+      const packageJson = readPackageJson(packageJsonPath);
+      const hasMatchingDependency = [
+        "dependencies",
+        "devDependencies",
+        "peerDependencies",
+        "optionalDependencies",
+      ].some((section) =>
+        Object.keys(packageJson[section] ?? {}).some((name) => name.startsWith(prefix)),
+      );
+      if (!hasMatchingDependency) {
+        return {
+          hasUpdates: false,
+          updates: {},
+          count: 0,
+          message: "All packages are up to date",
+        };
+      }
+    }
+
     // Use ncu API instead of CLI
-    const result = await ncuPackage.default({
+    const ncu = await loadNcu();
+    const result = await ncu({
       packageFile: packageJsonPath,
       silent: true,
       jsonUpgraded: true,
@@ -152,7 +184,8 @@ const interactiveUpdate = async (
 
   try {
     // Use ncu API to apply updates for selected packages
-    await ncuPackage.default({
+    const ncu = await loadNcu();
+    await ncu({
       packageFile: packageJsonPath,
       upgrade: true,
       filter: selectedFilter,
@@ -194,12 +227,29 @@ const interactiveUpdate = async (
   }
 };
 
+/**
+ * Parsed package.json cache keyed by path, invalidated by mtime, so listing
+ * current versions for N packages doesn't re-read and re-parse the same file N times
+ */
+const packageJsonCache = new Map<string, { mtimeMs: number; data: Record<string, any> }>();
+
+const readPackageJson = (packageJsonPath: string): Record<string, any> => {
+  const { mtimeMs } = fs.statSync(packageJsonPath);
+  const cached = packageJsonCache.get(packageJsonPath);
+  if (cached && cached.mtimeMs === mtimeMs) {
+    return cached.data;
+  }
+  const data = JSON.parse(fs.readFileSync(packageJsonPath, "utf8"));
+  packageJsonCache.set(packageJsonPath, { mtimeMs, data });
+  return data;
+};
+
 /**
  * Get current version of a package from package.json
  */
 const getCurrentVersion = (packageName: string, packageJsonPath: string): string => {
   try {
-    const packageJson = JSON.parse(fs.readFileSync(packageJsonPath, "utf8"));
+    const packageJson = readPackageJson(packageJsonPath);
 
     // Check in different dependency sections
     for (const section of [
@@ -264,7 +314,8 @@ export const registerUpdateCommand = (program: Command): void => {
             const packageJsonPath = path.join(rootDir, "package.json");
 
             // Use ncu API to apply updates
-            await ncuPackage.default({
+            const ncu = await loadNcu();
+            await ncu({
               packageFile: packageJsonPath,
               upgrade: true,
               filter: filter,
@@ -66,7 +66,16 @@ const upsertEnvValues = (envPath: string, values: Record<string, string>) => {
     }
   }
 
-  fs.writeFileSync(envPath, content, "utf-8");
+  // Publish atomically: a crash mid-write must not leave a truncated .env
+  // that later runs would consume as valid credentials
+  const tempPath = `${envPath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tempPath, content, "utf-8");
+    fs.renameSync(tempPath, envPath);
+  } catch (error) {
+    fs.rmSync(tempPath, { force: true });
+    throw error;
+  }
 };
 
 export const resolveAuthConfig = async (options: ResolveAuthOptions = {}): Promise<AuthConfig> => {
@@ -23,50 +23,64 @@ export const generateMcpServerConfig = (): McpServerConfig => {
   };
 };
 
+type CachedDependencies = { mtimeMs: number; dependencies: Record<string, string> };
+
+// Both project checks below inspect the same package.json; cache the merged
+// dependency map keyed by mtime so the file is read and parsed once per run
+const dependencyCache = new Map<string, CachedDependencies>();
+
 /**
- * Check if current directory is a VoltAgent project
+ * Read and merge dependencies/devDependencies from the current project's package.json
  */
-export const isVoltAgentProject = async (): Promise<boolean> => {
+const readProjectDependencies = async (): Promise<Record<string, string> | null> => {
   const packageJsonPath = path.join(process.cwd(), "package.json");
 
   if (!fs.existsSync(packageJsonPath)) {
-    return false;
+    return null;
   }
 
   try {
+    const { mtimeMs } = await fs.stat(packageJsonPath);
+    const cached = dependencyCache.get(packageJsonPath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return cached.dependencies;
+    }
+
     const packageJson = JSON.parse(await fs.readFile(packageJsonPath, "utf-8"));
     const dependencies = {
       ...packageJson.dependencies,
       ...packageJson.devDependencies,
     };
 
-    return Object.keys(dependencies).some((dep) => dep.includes("@voltagent/"));
+    dependencyCache.set(packageJsonPath, { mtimeMs, dependencies });
+    return dependencies;
   } catch {
-    return false;
+    return null;
   }
 };
 
 /**
- * Check if MCP docs server is already installed
+ * Check if current directory is a VoltAgent project
  */
-export const isMcpDocsInstalled = async (): Promise<boolean> => {
-  const packageJsonPath = path.join(process.cwd(), "package.json");
-
-  if (!fs.existsSync(packageJsonPath)) {
+export const isVoltAgentProject = async (): Promise<boolean> => {
+  const dependencies = await readProjectDependencies();
+  if (!dependencies) {
     return false;
   }
 
-  try {
-    const packageJson = JSON.parse(await fs.readFile(packageJsonPath, "utf-8"));
-    const dependencies = {
-      ...packageJson.dependencies,
-      ...packageJson.devDependencies,
-    };
+  return Object.keys(dependencies).some((dep) => dep.includes("@voltagent/"));
+};
 
-    return "@voltagent/docs-mcp" in dependencies;
-  } catch {
+/**
+ * Check if MCP docs server is already installed
+ */
+export const isMcpDocsInstalled = async (): Promise<boolean> => {
+  const dependencies = await readProjectDependencies();
+  if (!dependencies) {
     return false;
   }
+
+  return "@voltagent/docs-mcp" in dependencies;
 };
 
 /**
@@ -165,9 +165,11 @@ import type {
   AgentFeedbackOptions,
   AgentFullState,
   AgentGuardrailState,
+  AgentGuardrailStateGroup,
   AgentModelConfig,
   AgentModelValue,
   AgentOptions,
+  AgentScorerState,
   AgentSummarizationOptions,
   AgentToolRoutingState,
   ApiToolInfo,
@@ -1163,7 +1165,7 @@ export class Agent {
               operation: "generateText",
               metadata: {
                 finishReason: result.finishReason,
-                usage: usageForFinish ? JSON.parse(safeStringify(usageForFinish)) : undefined,
+                usage: usageForFinish ? { ...usageForFinish } : undefined,
                 toolCalls: aggregatedToolCalls,
               },
             });
@@ -1844,7 +1846,7 @@ export class Agent {
                   operation: "streamText",
                   metadata: {
                     finishReason: finalResult.finishReason,
-                    usage: usageForFinish ? JSON.parse(safeStringify(usageForFinish)) : undefined,
+                    usage: usageForFinish ? { ...usageForFinish } : undefined,
                     toolCalls: finalResult.toolCalls,
                   },
                 });
@@ -2505,7 +2507,7 @@ export class Agent {
               operation: "generateObject",
               metadata: {
                 finishReason: result.finishReason,
-                usage: usageForFinish ? JSON.parse(safeStringify(usageForFinish)) : undefined,
+                usage: usageForFinish ? { ...usageForFinish } : undefined,
                 schemaName,
               },
             });
@@ -2977,7 +2979,7 @@ export class Agent {
                     operation: "streamObject",
                     metadata: {
                       finishReason: finalResult.finishReason,
-                      usage: usageForFinish ? JSON.parse(safeStringify(usageForFinish)) : undefined,
+                      usage: usageForFinish ? { ...usageForFinish } : undefined,
                       schemaName,
                     },
                   });
@@ -6661,6 +6663,16 @@ export class Agent {
     return this.model.modelId || "unknown";
   }
 
+  /**
+   * Guardrail and scorer state snapshots are derived purely from
+   * construction-time config, so they are built once on first use and shared
+   * across getFullState calls instead of being rebuilt per snapshot. The
+   * shared layers are frozen when built, so callers cannot mutate the state
+   * handed to every other caller.
+   */
+  private guardrailStateSnapshot?: AgentGuardrailStateGroup;
+  private scorerStateSnapshot?: AgentScorerState[];
+
   /**
    * Get full agent state
    */
@@ -6669,12 +6681,18 @@ export class Agent {
       if (!value || typeof value !== "object" || Array.isArray(value)) {
         return null;
       }
-      const result = Object.fromEntries(
-        Object.entries(value as Record<string, unknown>).filter(
-          ([, entryValue]) => typeof entryValue !== "function",
-        ),
-      );
-      return Object.keys(result).length > 0 ? result : null;
+      // Copy the non-function entries in one pass; the previous
+      // entries/filter/fromEntries/keys chain built three intermediate arrays
+      // per record and this runs for every guardrail and scorer snapshot
+      const result: Record<string, unknown> = {};
+      let size = 0;
+      for (const [key, entryValue] of Object.entries(value as Record<string, unknown>)) {
+        if (typeof entryValue !== "function") {
+          result[key] = entryValue;
+          size += 1;
+        }
+      }
+      return size > 0 ? result : null;
     };
 
     const slugifyGuardrailIdentifier = (value: string): string => {
@@ -6720,46 +6738,70 @@ export class Agent {
       });
     };
 
-    const guardrails = {
-      input: mapGuardrails(this.inputGuardrails, "input"),
-      output: mapGuardrails(this.outputGuardrails, "output"),
+    // Freeze the layers the snapshot owns (the per-call copies the old code
+    // handed out); values nested inside metadata/params stay caller-owned
+    const freezeGuardrailState = (state: AgentGuardrailState): AgentGuardrailState => {
+      if (state.tags) {
+        Object.freeze(state.tags);
+      }
+      if (state.metadata) {
+        Object.freeze(state.metadata);
+      }
+      return Object.freeze(state);
     };
 
-    const scorerEntries = Object.entries(this.evalConfig?.scorers ?? {});
-    const scorers =
-      scorerEntries.length > 0
-        ? scorerEntries.map(([key, scorerConfig]) => {
-            const definition =
-              typeof scorerConfig.scorer === "object" && scorerConfig.scorer !== null
-                ? (scorerConfig.scorer as {
-                    id?: string;
-                    name?: string;
-                    metadata?: unknown;
-                    sampling?: SamplingPolicy;
-                  })
-                : undefined;
-            const scorerId = String(scorerConfig.id ?? definition?.id ?? key);
-            const scorerName =
-              (typeof definition?.name === "string" && definition.name.trim().length > 0
-                ? definition.name
-                : undefined) ?? scorerId;
-            const sampling =
-              scorerConfig.sampling ?? definition?.sampling ?? this.evalConfig?.sampling;
-            const metadata = cloneRecord(definition?.metadata ?? null);
-            const params =
-              typeof scorerConfig.params === "function" ? null : cloneRecord(scorerConfig.params);
+    if (!this.guardrailStateSnapshot) {
+      const input = mapGuardrails(this.inputGuardrails, "input").map(freezeGuardrailState);
+      const output = mapGuardrails(this.outputGuardrails, "output").map(freezeGuardrailState);
+      this.guardrailStateSnapshot = Object.freeze({
+        input: Object.freeze(input),
+        output: Object.freeze(output),
+      }) as AgentGuardrailStateGroup;
+    }
+    const guardrails = this.guardrailStateSnapshot;
+
+    if (!this.scorerStateSnapshot) {
+      const scorerEntries = Object.entries(this.evalConfig?.scorers ?? {});
+      const built = scorerEntries.map(([key, scorerConfig]) => {
+        const definition =
+          typeof scorerConfig.scorer === "object" && scorerConfig.scorer !== null
+            ? (scorerConfig.scorer as {
+                id?: string;
+                name?: string;
+                metadata?: unknown;
+                sampling?: SamplingPolicy;
+              })
+            : undefined;
+        const scorerId = String(scorerConfig.id ?? definition?.id ?? key);
+        const scorerName =
+          (typeof definition?.name === "string" && definition.name.trim().length > 0
+            ? definition.name
+            : undefined) ?? scorerId;
+        const sampling = scorerConfig.sampling ?? definition?.sampling ?? this.evalConfig?.sampling;
+        const metadata = cloneRecord(definition?.metadata ?? null);
+        const params =
+          typeof scorerConfig.params === "function" ? null : cloneRecord(scorerConfig.params);
 
-            return {
-              key,
-              id: scorerId,
-              name: scorerName,
-              sampling,
-              metadata,
-              params,
-              node_id: createNodeId(NodeType.SCORER, scorerId, this.id),
-            };
-          })
-        : [];
+        if (metadata) {
+          Object.freeze(metadata);
+        }
+        if (params) {
+          Object.freeze(params);
+        }
+
+        return Object.freeze({
+          key,
+          id: scorerId,
+          name: scorerName,
+          sampling,
+          metadata,
+          params,
+          node_id: createNodeId(NodeType.SCORER, scorerId, this.id),
+        });
+      });
+      this.scorerStateSnapshot = Object.freeze(built) as AgentScorerState[];
+    }
+    const scorers = this.scorerStateSnapshot;
 
     const activeMemory = this.getMemory();
     const memoryInstance: Memory | undefined = activeMemory || undefined;
@@ -1,5 +1,5 @@
 import type { ModelMessage } from "@ai-sdk/provider-utils";
-import type { Logger } from "@voltagent/internal";
+import { type Logger, safeStringify } from "@voltagent/internal";
 import type { UIMessage, UIMessagePart } from "ai";
 
 import { randomUUID } from "../utils/id";
@@ -7,6 +7,19 @@ import { convertModelMessagesToUIMessages } from "../utils/message-converter";
 
 type MessageSource = "user" | "system" | "memory" | "response";
 
+// Resolved once at module load; structuredClone beats the JSON round-trip
+// fallback and availability doesn't change at runtime.
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<T>(value: T) => T)
+  | undefined;
+
+const cloneValue = <T>(value: T): T => {
+  if (typeof structuredCloneImpl === "function") {
+    return structuredCloneImpl(value);
+  }
+  return JSON.parse(safeStringify(value)) as T;
+};
+
 interface PendingMessage {
   id: string;
   message: UIMessage;
@@ -223,17 +236,6 @@ export class ConversationBuffer {
     const incomingConsumed = new Map<string, number>();
     let modified = false;
 
-    const structuredCloneImpl = (globalThis as any).structuredClone as
-      | (<T>(value: T) => T)
-      | undefined;
-
-    const cloneValue = <T>(value: T): T => {
-      if (typeof structuredCloneImpl === "function") {
-        return structuredCloneImpl(value);
-      }
-      return JSON.parse(JSON.stringify(value)) as T;
-    };
-
     const clonePart = <T extends UIMessagePart<any, any>>(part: T): T => cloneValue(part);
 
     const lastAssistantMessageIndex = lastAssistantIndex;
@@ -877,11 +877,25 @@ function buildEvalMessageChain(
   return merged.length > 0 ? merged : undefined;
 }
 
+// Resolved once; native structuredClone skips the stringify/parse round trip
+// when the runtime provides it
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<TValue>(input: TValue) => TValue)
+  | undefined;
+
 function cloneUnknownArray<T>(value: unknown): T[] | undefined {
   if (!Array.isArray(value)) {
     return undefined;
   }
 
+  if (typeof structuredCloneImpl === "function") {
+    try {
+      return structuredCloneImpl(value) as T[];
+    } catch {
+      // Non-cloneable entries (e.g. functions); fall back to the JSON path
+    }
+  }
+
   try {
     return JSON.parse(safeStringify(value)) as T[];
   } catch {
@@ -999,6 +1013,13 @@ function normalizeEvalString(value: unknown): string | null {
 }
 
 function cloneEvalPayload(payload: AgentEvalPayload): AgentEvalPayload {
+  if (typeof structuredCloneImpl === "function") {
+    try {
+      return structuredCloneImpl(payload);
+    } catch {
+      // Fall back to the JSON round trip for non-cloneable payload values
+    }
+  }
   return JSON.parse(safeStringify(payload)) as AgentEvalPayload;
 }
 
@@ -33,15 +33,17 @@ type SanitizeMessagesOptions = {
   filterIncompleteToolCalls?: boolean;
 };
 
+// Resolved once: structuredClone is both faster and more faithful than a JSON
+// round trip, and the runtime either has it or it doesn't.
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<TValue>(input: TValue) => TValue)
+  | undefined;
+
 const safeClone = <T>(value: T): T => {
   if (!isObject(value) && !Array.isArray(value)) {
     return value;
   }
 
-  const structuredCloneImpl = (globalThis as any).structuredClone as
-    | (<TValue>(input: TValue) => TValue)
-    | undefined;
-
   if (typeof structuredCloneImpl === "function") {
     return structuredCloneImpl(value);
   }
@@ -57,11 +59,25 @@ const safeClone = <T>(value: T): T => {
 };
 
 const compactObject = <T extends Record<string, unknown>>(value: T): T => {
-  const entries = Object.entries(value).filter(([, entryValue]) => entryValue !== undefined);
-  if (entries.length === Object.keys(value).length) {
+  // Most objects carry no undefined entries, so detect that case first and
+  // return the input untouched before paying for a rebuilt copy
+  let needsCompaction = false;
+  for (const key of Object.keys(value)) {
+    if (value[key] === undefined) {
+      needsCompaction = true;
+      break;
+    }
+  }
+  if (!needsCompaction) {
     return value;
   }
-  return Object.fromEntries(entries) as T;
+  const compacted: Record<string, unknown> = {};
+  for (const [key, entryValue] of Object.entries(value)) {
+    if (entryValue !== undefined) {
+      compacted[key] = entryValue;
+    }
+  }
+  return compacted as T;
 };
 
 const normalizeText = (part: TextLikePart) => {
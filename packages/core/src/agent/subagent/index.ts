@@ -370,7 +370,7 @@ ${guidelinesText}
       if (context && context.size > 0) {
         const contextObj = Object.fromEntries(context.entries());
         taskContent = `Task handed off from ${sourceAgent?.name || this.agentName} to ${targetAgent.name}:
-${task}\n\nContext: ${safeStringify(contextObj, { indentation: 2 })}`;
+${task}\n\nContext: ${safeStringify(contextObj)}`;
       }
 
       const taskMessage: UIMessage = {
@@ -796,16 +796,19 @@ ${task}\n\nContext: ${safeStringify(contextObj, { indentation: 2 })}`;
             throw new Error("At least one target agent must be specified");
           }
 
-          // Find matching agents by name
+          // Find matching agents by name. Bucket configs by name once so each
+          // requested agent is a map lookup instead of a scan over all configs.
+          const configsByName = new Map<string, SubAgentConfig>();
+          for (const agentConfig of this.subAgentConfigs) {
+            configsByName.set(this.extractAgentName(agentConfig), agentConfig);
+          }
+          const availableAgentNames = Array.from(configsByName.keys()).join(", ");
+
           const agents = targetAgents
             .map((name: string) => {
-              const agentConfig = this.subAgentConfigs.find(
-                (a: SubAgentConfig) => this.extractAgentName(a) === name,
-              );
+              const agentConfig = configsByName.get(name);
               if (!agentConfig) {
-                logger.warn(
-                  `Agent "${name}" not found. Available agents: ${this.subAgentConfigs.map((a) => this.extractAgentName(a)).join(", ")}`,
-                );
+                logger.warn(`Agent "${name}" not found. Available agents: ${availableAgentNames}`);
               }
               return agentConfig;
             })
@@ -816,7 +819,7 @@ ${task}\n\nContext: ${safeStringify(contextObj, { indentation: 2 })}`;
 
           if (agents.length === 0) {
             throw new Error(
-              `No valid target agents found. Available agents: ${this.subAgentConfigs.map((a) => this.extractAgentName(a)).join(", ")}`,
+              `No valid target agents found. Available agents: ${availableAgentNames}`,
             );
           }
 
@@ -1,5 +1,11 @@
 import { safeStringify } from "@voltagent/internal/utils";
 
+// Looked up once at module load; scorer results are cloned per evaluation and
+// the native implementation is considerably cheaper than a JSON round trip.
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<T>(value: T) => T)
+  | undefined;
+
 import type { LocalScorerDefinition } from "./runtime";
 
 export interface ScorerPipelineContext<
@@ -221,6 +227,14 @@ function cloneMetadata(
     return null;
   }
 
+  if (structuredCloneImpl) {
+    try {
+      return structuredCloneImpl(value);
+    } catch {
+      // Non-cloneable entries (e.g. functions); fall back to the JSON path
+    }
+  }
+
   try {
     return JSON.parse(safeStringify(value)) as Record<string, unknown>;
   } catch {
@@ -238,6 +252,14 @@ function getErrorMetadata(error: unknown): Record<string, unknown> | null {
     return null;
   }
 
+  if (structuredCloneImpl) {
+    try {
+      return structuredCloneImpl(metadata) as Record<string, unknown>;
+    } catch {
+      // Non-cloneable entries (e.g. functions); fall back to the JSON path
+    }
+  }
+
   try {
     return JSON.parse(safeStringify(metadata)) as Record<string, unknown>;
   } catch {
@@ -377,11 +377,25 @@ function mergeMetadata(
   return Object.keys(base).length > 0 ? base : null;
 }
 
+// Prefer native structuredClone over a stringify/parse round trip; resolved
+// once at module load
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<TValue>(input: TValue) => TValue)
+  | undefined;
+
 function cloneRecord(value: unknown): Record<string, unknown> | undefined {
   if (!value || typeof value !== "object") {
     return undefined;
   }
 
+  if (typeof structuredCloneImpl === "function") {
+    try {
+      return structuredCloneImpl(value) as Record<string, unknown>;
+    } catch {
+      // Records holding non-cloneable values go through the JSON path below
+    }
+  }
+
   try {
     return JSON.parse(safeStringify(value)) as Record<string, unknown>;
   } catch {
@@ -9,6 +9,50 @@ import { safeStringify } from "@voltagent/internal/utils";
 import { getEnvVar } from "../utils/runtime";
 import { SimpleEventEmitter } from "../utils/simple-event-emitter";
 
+/**
+ * Map severity to OpenTelemetry severity number
+ */
+const OTEL_SEVERITY_MAP: Record<string, number> = {
+  trace: 1,
+  debug: 5,
+  info: 9,
+  warn: 13,
+  error: 17,
+  fatal: 21,
+};
+
+/**
+ * Log levels ordered by severity; shared by every level check
+ */
+const LOG_LEVELS = ["trace", "debug", "info", "warn", "error", "fatal"];
+
+/**
+ * Numeric priorities used when filtering buffered logs by level
+ */
+const LEVEL_PRIORITIES: Record<string, number> = {
+  trace: 10,
+  debug: 20,
+  info: 30,
+  warn: 40,
+  error: 50,
+  fatal: 60,
+};
+
+// Reuse one OTel logger per provider rather than re-acquiring it on every
+// emitted record; the provider can be swapped at runtime, so key by instance
+let cachedOtelProvider: unknown;
+let cachedOtelLogger: any;
+
+const getOtelLogger = (loggerProvider: any): any => {
+  if (loggerProvider !== cachedOtelProvider) {
+    cachedOtelLogger = loggerProvider.getLogger("voltagent-console", "1.0.0", {
+      includeTraceContext: true,
+    });
+    cachedOtelProvider = loggerProvider;
+  }
+  return cachedOtelLogger;
+};
+
 /**
  * Simple console logger that implements the Logger interface
  */
@@ -22,9 +66,8 @@ export class ConsoleLogger implements Logger {
   }
 
   private shouldLog(level: string): boolean {
-    const levels = ["trace", "debug", "info", "warn", "error", "fatal"];
-    const currentLevelIndex = levels.indexOf(this.level);
-    const messageLevelIndex = levels.indexOf(level);
+    const currentLevelIndex = LOG_LEVELS.indexOf(this.level);
+    const messageLevelIndex = LOG_LEVELS.indexOf(level);
     return messageLevelIndex >= currentLevelIndex;
   }
 
@@ -44,21 +87,9 @@ export class ConsoleLogger implements Logger {
     }
 
     try {
-      const otelLogger = loggerProvider.getLogger("voltagent-console", "1.0.0", {
-        includeTraceContext: true,
-      });
-
-      // Map severity to OpenTelemetry severity number
-      const severityMap: Record<string, number> = {
-        trace: 1,
-        debug: 5,
-        info: 9,
-        warn: 13,
-        error: 17,
-        fatal: 21,
-      };
+      const otelLogger = getOtelLogger(loggerProvider);
 
-      const severityNumber = severityMap[level] || 9;
+      const severityNumber = OTEL_SEVERITY_MAP[level] || 9;
 
       // Emit the log record while preserving the current context so trace/span ids propagate
       const globalSpanGetter = (
@@ -145,6 +176,8 @@ export function createConsoleLogger(options: { name?: string; level?: string } =
  */
 export class InMemoryLogBuffer extends SimpleEventEmitter implements LogBuffer {
   private logs: LogEntry[] = [];
+  // Index of the oldest retained entry; see add() for the trim strategy
+  private head = 0;
   private maxSize: number;
 
   constructor(maxSize = 1000) {
@@ -154,9 +187,15 @@ export class InMemoryLogBuffer extends SimpleEventEmitter implements LogBuffer {
 
   add(entry: LogEntry): void {
     this.logs.push(entry);
-    // Keep only the last maxSize entries
-    if (this.logs.length > this.maxSize) {
-      this.logs = this.logs.slice(-this.maxSize);
+    // Keep only the last maxSize entries. Overflow advances the head cursor
+    // instead of copying the whole array per add; the dropped prefix is
+    // compacted away in one slice once it grows as large as the live window.
+    if (this.logs.length - this.head > this.maxSize) {
+      this.head += 1;
+      if (this.head >= this.maxSize) {
+        this.logs = this.logs.slice(this.head);
+        this.head = 0;
+      }
     }
     // Emit event for new log
     this.emit("log-added", entry);
@@ -164,10 +203,11 @@ export class InMemoryLogBuffer extends SimpleEventEmitter implements LogBuffer {
 
   query(filter?: LogFilter): LogEntry[] {
     if (!filter) {
-      return [...this.logs];
+      return this.logs.slice(this.head);
     }
 
     const results = this.logs
+      .slice(this.head)
       .filter((log) => {
         // Filter by level - show logs at this level and higher severity
         if (filter.level) {
@@ -195,23 +235,17 @@ export class InMemoryLogBuffer extends SimpleEventEmitter implements LogBuffer {
 
   clear(): void {
     this.logs = [];
+    this.head = 0;
   }
 
   private getLevelPriority(level: string): number {
-    const priorities: Record<string, number> = {
-      trace: 10,
-      debug: 20,
-      info: 30,
-      warn: 40,
-      error: 50,
-      fatal: 60,
-    };
-
-    return priorities[level.toLowerCase()] || 0;
+    // Levels are stored lowercase already; only allocate a lowercased copy
+    // for the rare caller that passes mixed case
+    return LEVEL_PRIORITIES[level] ?? LEVEL_PRIORITIES[level.toLowerCase()] ?? 0;
   }
 
   size(): number {
-    return this.logs.length;
+    return this.logs.length - this.head;
   }
 }
 
@@ -3,6 +3,36 @@ import { logs } from "@opentelemetry/api-logs";
 import type { LogFn, Logger } from "@voltagent/internal";
 import { getGlobalLogger } from "./index";
 
+/**
+ * Map severity to OpenTelemetry severity number
+ */
+// Ordered from least to most severe; shared by every shouldLog call
+const LOG_LEVELS = ["trace", "debug", "info", "warn", "error", "fatal"];
+
+const OTEL_SEVERITY_MAP: Record<string, number> = {
+  trace: 1,
+  debug: 5,
+  info: 9,
+  warn: 13,
+  error: 17,
+  fatal: 21,
+};
+
+// Reuse one OTel logger per provider rather than re-acquiring it on every
+// emitted record; the provider can be swapped at runtime, so key by instance
+let cachedOtelProvider: unknown;
+let cachedOtelLogger: ReturnType<typeof logs.getLogger> | undefined;
+
+const getOtelLogger = (loggerProvider: unknown): ReturnType<typeof logs.getLogger> => {
+  if (loggerProvider !== cachedOtelProvider || !cachedOtelLogger) {
+    cachedOtelLogger = logs.getLogger("voltagent", "1.0.0", {
+      includeTraceContext: true,
+    });
+    cachedOtelProvider = loggerProvider;
+  }
+  return cachedOtelLogger;
+};
+
 /**
  * LoggerProxy implements the Logger interface but delegates all calls to the current global logger.
  * This allows agents and workflows to be created before VoltAgent sets the global logger,
@@ -13,10 +43,16 @@ import { getGlobalLogger } from "./index";
 export class LoggerProxy implements Logger {
   private bindings: Record<string, any>;
   private externalLogger?: Logger;
+  private hasBindings: boolean;
+  // Bound child logger cached per base instance; the global logger can be
+  // swapped at runtime, so a base change invalidates the cache
+  private cachedBaseLogger?: Logger;
+  private cachedBoundLogger?: Logger;
 
   constructor(bindings: Record<string, any> = {}, externalLogger?: Logger) {
     this.bindings = bindings;
     this.externalLogger = externalLogger;
+    this.hasBindings = Object.keys(bindings).length > 0;
   }
 
   /**
@@ -25,16 +61,22 @@ export class LoggerProxy implements Logger {
   private getActualLogger(): Logger {
     // Use external logger if provided, otherwise use global logger
     const baseLogger = this.externalLogger || getGlobalLogger();
-    // Apply bindings if any
-    return Object.keys(this.bindings).length > 0 ? baseLogger.child(this.bindings) : baseLogger;
+    if (!this.hasBindings) {
+      return baseLogger;
+    }
+    // Create the bound child lazily and reuse it on subsequent calls instead
+    // of allocating a fresh child logger for every emitted record
+    if (this.cachedBaseLogger !== baseLogger || !this.cachedBoundLogger) {
+      this.cachedBoundLogger = baseLogger.child(this.bindings);
+      this.cachedBaseLogger = baseLogger;
+    }
+    return this.cachedBoundLogger;
   }
 
   /**
    * Check if a log level should be logged based on the configured level
    */
-  private shouldLog(messageLevel: string): boolean {
-    const logger = this.getActualLogger();
-
+  private shouldLog(logger: Logger, messageLevel: string): boolean {
     // Try to get the level from the logger instance
     let configuredLevel: string | undefined;
 
@@ -53,9 +95,8 @@ export class LoggerProxy implements Logger {
     }
 
     // Map log levels to numeric priorities
-    const levels = ["trace", "debug", "info", "warn", "error", "fatal"];
-    const configuredLevelIndex = levels.indexOf(configuredLevel.toLowerCase());
-    const messageLevelIndex = levels.indexOf(messageLevel.toLowerCase());
+    const configuredLevelIndex = LOG_LEVELS.indexOf(configuredLevel.toLowerCase());
+    const messageLevelIndex = LOG_LEVELS.indexOf(messageLevel.toLowerCase());
 
     // If either level is not found, allow the log
     if (configuredLevelIndex === -1 || messageLevelIndex === -1) {
@@ -75,21 +116,9 @@ export class LoggerProxy implements Logger {
     if (!loggerProvider) return;
 
     try {
-      const otelLogger = logs.getLogger("voltagent", "1.0.0", {
-        includeTraceContext: true,
-      });
-
-      // Map severity to OpenTelemetry severity number
-      const severityMap: Record<string, number> = {
-        trace: 1,
-        debug: 5,
-        info: 9,
-        warn: 13,
-        error: 17,
-        fatal: 21,
-      };
+      const otelLogger = getOtelLogger(loggerProvider);
 
-      const severityNumber = severityMap[severity] || 9;
+      const severityNumber = OTEL_SEVERITY_MAP[severity] || 9;
 
       // Emit the log record
       const globalSpanGetter = (
@@ -121,9 +150,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("trace", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("trace")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "trace")) return;
     logger.trace(msg, context);
   };
 
@@ -131,9 +160,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("debug", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("debug")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "debug")) return;
     logger.debug(msg, context);
   };
 
@@ -141,9 +170,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("info", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("info")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "info")) return;
     logger.info(msg, context);
   };
 
@@ -151,9 +180,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("warn", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("warn")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "warn")) return;
     logger.warn(msg, context);
   };
 
@@ -161,9 +190,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("error", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("error")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "error")) return;
     logger.error(msg, context);
   };
 
@@ -171,9 +200,9 @@ export class LoggerProxy implements Logger {
     // Always emit to OpenTelemetry regardless of configured level
     this.emitOtelLog("fatal", msg, context);
 
-    // Only log to console/stdout if level check passes
-    if (!this.shouldLog("fatal")) return;
+    // Resolve the delegate once; the level check and the call share it
     const logger = this.getActualLogger();
+    if (!this.shouldLog(logger, "fatal")) return;
     logger.fatal(msg, context);
   };
 
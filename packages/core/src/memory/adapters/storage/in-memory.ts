@@ -90,6 +90,10 @@ export class InMemoryStorageAdapter implements StorageAdapter {
   private workflowStates: Map<string, WorkflowStateEntry> = new Map();
   private workflowStatesByWorkflow: Map<string, Set<string>> = new Map();
   private conversationSteps = new Map<string, Map<string, ConversationStepRecord[]>>();
+  // Secondary indexes so filtered conversation queries avoid scanning every
+  // conversation; maintained by create/update/delete
+  private conversationIdsByUser: Map<string, Set<string>> = new Map();
+  private conversationIdsByResource: Map<string, Set<string>> = new Map();
 
   // ============================================================================
   // Message Operations
@@ -166,21 +170,21 @@ export class InMemoryStorageAdapter implements StorageAdapter {
 
     // Get user's messages or return empty array
     const userMessages = this.storage[userId] || {};
-    let messages = userMessages[conversationId] || [];
-
-    // Apply role filter if provided
-    if (roles && roles.length > 0) {
-      messages = messages.filter((m) => roles.includes(m.role));
-    }
-
-    // Apply time filters if provided
-    if (before) {
-      messages = messages.filter((m) => m.createdAt.getTime() < before.getTime());
-    }
-
-    if (after) {
-      messages = messages.filter((m) => m.createdAt.getTime() > after.getTime());
-    }
+    const stored = userMessages[conversationId] || [];
+
+    // Resolve the active filters once and evaluate them in a single pass
+    // instead of rebuilding the array per clause; the pass also produces a
+    // fresh array, so the sort below never reorders the stored messages
+    const roleSet = roles && roles.length > 0 ? new Set(roles) : undefined;
+    const beforeTime = before?.getTime();
+    const afterTime = after?.getTime();
+
+    let messages = stored.filter((m) => {
+      if (roleSet && !roleSet.has(m.role)) return false;
+      if (beforeTime !== undefined && m.createdAt.getTime() >= beforeTime) return false;
+      if (afterTime !== undefined && m.createdAt.getTime() <= afterTime) return false;
+      return true;
+    });
 
     // Sort by creation time (oldest first for conversation flow)
     messages.sort((a, b) => a.createdAt.getTime() - b.createdAt.getTime());
@@ -327,9 +331,99 @@ export class InMemoryStorageAdapter implements StorageAdapter {
     };
 
     this.conversations.set(conversation.id, conversation);
+    this.indexConversation(conversation);
     return deepClone(conversation);
   }
 
+  /**
+   * Add a conversation to the user and resource indexes
+   */
+  private indexConversation(conversation: Conversation): void {
+    this.addToConversationIndex(this.conversationIdsByUser, conversation.userId, conversation.id);
+    this.addToConversationIndex(
+      this.conversationIdsByResource,
+      conversation.resourceId,
+      conversation.id,
+    );
+  }
+
+  /**
+   * Remove a conversation from the user and resource indexes
+   */
+  private unindexConversation(conversation: Conversation): void {
+    this.removeFromConversationIndex(
+      this.conversationIdsByUser,
+      conversation.userId,
+      conversation.id,
+    );
+    this.removeFromConversationIndex(
+      this.conversationIdsByResource,
+      conversation.resourceId,
+      conversation.id,
+    );
+  }
+
+  private addToConversationIndex(index: Map<string, Set<string>>, key: string, id: string): void {
+    const bucket = index.get(key);
+    if (bucket) {
+      bucket.add(id);
+    } else {
+      index.set(key, new Set([id]));
+    }
+  }
+
+  private removeFromConversationIndex(
+    index: Map<string, Set<string>>,
+    key: string,
+    id: string,
+  ): void {
+    const bucket = index.get(key);
+    if (bucket) {
+      bucket.delete(id);
+      if (bucket.size === 0) {
+        index.delete(key);
+      }
+    }
+  }
+
+  /**
+   * Resolve the conversations matching the userId/resourceId filters via the
+   * indexes, falling back to a full listing only when no filter is set
+   */
+  private collectConversations(options: {
+    userId?: string;
+    resourceId?: string;
+  }): Conversation[] {
+    const { userId, resourceId } = options;
+    if (!userId && !resourceId) {
+      return Array.from(this.conversations.values());
+    }
+
+    let ids: Set<string> | undefined;
+    if (userId) {
+      ids = this.conversationIdsByUser.get(userId);
+      if (!ids) {
+        return [];
+      }
+    }
+    if (resourceId) {
+      const byResource = this.conversationIdsByResource.get(resourceId);
+      if (!byResource) {
+        return [];
+      }
+      ids = ids ? new Set(Array.from(ids).filter((id) => byResource.has(id))) : byResource;
+    }
+
+    const results: Conversation[] = [];
+    for (const id of ids as Set<string>) {
+      const conversation = this.conversations.get(id);
+      if (conversation) {
+        results.push(conversation);
+      }
+    }
+    return results;
+  }
+
   /**
    * Get a conversation by ID
    */
@@ -342,10 +436,7 @@ export class InMemoryStorageAdapter implements StorageAdapter {
    * Get conversations for a resource
    */
   async getConversations(resourceId: string): Promise<Conversation[]> {
-    const conversations = Array.from(this.conversations.values()).filter(
-      (c) => c.resourceId === resourceId,
-    );
-    return conversations.map((c) => deepClone(c));
+    return this.collectConversations({ resourceId }).map((c) => deepClone(c));
   }
 
   /**
@@ -362,16 +453,7 @@ export class InMemoryStorageAdapter implements StorageAdapter {
    * Query conversations with advanced options
    */
   async queryConversations(options: ConversationQueryOptions): Promise<Conversation[]> {
-    let conversations = Array.from(this.conversations.values());
-
-    // Apply filters
-    if (options.userId) {
-      conversations = conversations.filter((c) => c.userId === options.userId);
-    }
-
-    if (options.resourceId) {
-      conversations = conversations.filter((c) => c.resourceId === options.resourceId);
-    }
+    let conversations = this.collectConversations(options);
 
     // Apply sorting
     if (options.orderBy) {
@@ -405,17 +487,7 @@ export class InMemoryStorageAdapter implements StorageAdapter {
    * Count conversations matching query filters
    */
   async countConversations(options: ConversationQueryOptions): Promise<number> {
-    let conversations = Array.from(this.conversations.values());
-
-    if (options.userId) {
-      conversations = conversations.filter((c) => c.userId === options.userId);
-    }
-
-    if (options.resourceId) {
-      conversations = conversations.filter((c) => c.resourceId === options.resourceId);
-    }
-
-    return conversations.length;
+    return this.collectConversations(options).length;
   }
 
   /**
@@ -436,6 +508,13 @@ export class InMemoryStorageAdapter implements StorageAdapter {
       updatedAt: new Date().toISOString(),
     };
 
+    if (
+      updatedConversation.userId !== conversation.userId ||
+      updatedConversation.resourceId !== conversation.resourceId
+    ) {
+      this.unindexConversation(conversation);
+      this.indexConversation(updatedConversation);
+    }
     this.conversations.set(id, updatedConversation);
     return deepClone(updatedConversation);
   }
@@ -451,6 +530,7 @@ export class InMemoryStorageAdapter implements StorageAdapter {
 
     // Delete conversation
     this.conversations.delete(id);
+    this.unindexConversation(conversation);
 
     // Delete associated messages
     for (const userId in this.storage) {
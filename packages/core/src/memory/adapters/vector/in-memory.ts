@@ -1,12 +1,23 @@
 import { cosineSimilarity } from "../../utils/vector-math";
 import type { SearchResult, VectorAdapter, VectorItem } from "./types";
 
+/**
+ * Internal storage record. Vectors live in packed Float64Arrays, which use a
+ * fraction of the memory of a generic number[] and read faster in the
+ * similarity loop; they are converted back to plain arrays on the way out.
+ */
+interface StoredVectorItem {
+  id: string;
+  vector: Float64Array;
+  metadata?: Record<string, unknown>;
+}
+
 /**
  * Lightweight in-memory vector database adapter
  * Suitable for development, testing, and small datasets (< 10k vectors)
  */
 export class InMemoryVectorAdapter implements VectorAdapter {
-  private vectors: Map<string, VectorItem>;
+  private vectors: Map<string, StoredVectorItem>;
   private dimensions: number | null = null;
 
   constructor() {
@@ -25,7 +36,7 @@ export class InMemoryVectorAdapter implements VectorAdapter {
 
     this.vectors.set(id, {
       id,
-      vector: [...vector], // Clone to prevent external modifications
+      vector: Float64Array.from(vector), // Copy into packed storage
       metadata: metadata ? { ...metadata } : undefined,
     });
   }
@@ -57,7 +68,7 @@ export class InMemoryVectorAdapter implements VectorAdapter {
       );
     }
 
-    const results: SearchResult[] = [];
+    const candidates: Array<{ item: StoredVectorItem; score: number; distance: number }> = [];
 
     // Calculate similarities for all vectors
     for (const [, item] of this.vectors.entries()) {
@@ -72,18 +83,25 @@ export class InMemoryVectorAdapter implements VectorAdapter {
       const score = (similarity + 1) / 2;
 
       if (score >= threshold) {
-        results.push({
-          ...item,
+        candidates.push({
+          item,
           score,
           distance: 1 - similarity, // Convert to distance metric
         });
       }
     }
 
-    // Sort by score (descending) and limit results
-    results.sort((a, b) => b.score - a.score);
-
-    return results.slice(0, limit);
+    // Sort by score (descending), limit, and only then materialize plain
+    // arrays so the conversion cost is paid for returned results alone
+    candidates.sort((a, b) => b.score - a.score);
+
+    return candidates.slice(0, limit).map(({ item, score, distance }) => ({
+      id: item.id,
+      vector: Array.from(item.vector),
+      metadata: item.metadata,
+      score,
+      distance,
+    }));
   }
 
   async delete(id: string): Promise<void> {
@@ -113,8 +131,8 @@ export class InMemoryVectorAdapter implements VectorAdapter {
 
     // Return a copy to prevent external modifications
     return {
-      ...item,
-      vector: [...item.vector],
+      id: item.id,
+      vector: Array.from(item.vector),
       metadata: item.metadata ? { ...item.metadata } : undefined,
     };
   }
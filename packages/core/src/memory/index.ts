@@ -671,10 +671,11 @@ export class Memory {
     const mode = params.options?.mode || "replace";
 
     let finalContent: string;
+    let existingContent: string | null = null;
 
     if (mode === "append") {
       // Get existing content for append mode
-      const existingContent = await this.getWorkingMemory({
+      existingContent = await this.getWorkingMemory({
         conversationId: params.conversationId,
         userId: params.userId,
       });
@@ -726,6 +727,12 @@ export class Memory {
       }
     }
 
+    // Append mode already fetched the current content, so skip the storage
+    // round trip when the merge produced no change
+    if (mode === "append" && existingContent !== null && finalContent === existingContent) {
+      return;
+    }
+
     await this.storage.setWorkingMemory({
       conversationId: params.conversationId,
       userId: params.userId,
@@ -864,8 +871,9 @@ export class Memory {
     const schema = this.getWorkingMemorySchema();
     const scope = this.workingMemoryConfig.scope || "conversation";
 
-    // Build instructions based on format
-    let instructions = `CONVERSATION CONTEXT MANAGEMENT:
+    // Build instructions based on format, collecting parts and joining once
+    const parts: string[] = [];
+    parts.push(`CONVERSATION CONTEXT MANAGEMENT:
 You have access to persistent context storage that maintains information ${
       scope === "user" ? "across all conversations with this user" : "throughout this conversation"
     }.
@@ -890,63 +898,63 @@ CRITICAL UPDATE RULES:
 • **For JSON format**: In append mode, you can send partial updates
   - {userProfile: {name: "New"}} will only update the name field
   - Other fields remain untouched
-• **Best practice**: Always use append (default) unless explicitly replacing everything`;
+• **Best practice**: Always use append (default) unless explicitly replacing everything`);
 
     // Add format-specific instructions
     if (format === "json" && schema) {
-      instructions += `
+      parts.push(`
 6. Follow the exact JSON structure defined by the schema
 7. Include all required fields, leave optional fields empty if unknown
-8. Validate data types match the schema requirements`;
+8. Validate data types match the schema requirements`);
     } else if (format === "markdown") {
-      instructions += `
+      parts.push(`
 6. Maintain the template structure while updating content
 7. Use clear, concise bullet points and formatting
-8. Don't remove empty sections - preserve the template structure`;
+8. Don't remove empty sections - preserve the template structure`);
     }
 
     // Add template/schema information
     if (template) {
-      instructions += `
+      parts.push(`
 
 <context_template>
 ${template}
-</context_template>`;
+</context_template>`);
     } else if (schema && format === "json") {
       // For JSON schema, show a simplified structure
-      instructions += `
+      parts.push(`
 
 <context_structure>
 JSON object following the defined schema
-</context_structure>`;
+</context_structure>`);
     }
 
     // Add current data if exists
     if (currentData) {
-      instructions += `
+      parts.push(`
 
 <current_context>
 ${currentData}
-</current_context>`;
+</current_context>`);
     } else {
-      instructions += `
+      parts.push(`
 
 <current_context>
 No context stored yet - begin capturing relevant information immediately
-</current_context>`;
+</current_context>`);
     }
 
     // Add usage notes
-    instructions += `
+    parts.push(`
 
 Remember:
 - Call update_working_memory whenever you learn something worth remembering
 - Information persists ${scope === "user" ? "across all conversations" : "throughout the conversation"}
 - Update context naturally during conversation flow
 - Context helps maintain continuity when conversation history is limited
-- Always preserve existing information unless explicitly updating it`;
+- Always preserve existing information unless explicitly updating it`);
 
-    return instructions;
+    return parts.join("");
   }
 
   // ============================================================================
@@ -7,7 +7,7 @@
  * Returns a value between -1 and 1, where 1 means identical direction,
  * 0 means perpendicular, and -1 means opposite direction
  */
-export function cosineSimilarity(a: number[], b: number[]): number {
+export function cosineSimilarity(a: ArrayLike<number>, b: ArrayLike<number>): number {
   if (a.length !== b.length) {
     throw new Error(`Vectors must have same length. Got ${a.length} and ${b.length}`);
   }
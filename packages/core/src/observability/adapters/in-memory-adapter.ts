@@ -6,11 +6,12 @@
  */
 
 import { safeStringify } from "@voltagent/internal";
-import type {
-  LogFilter,
-  ObservabilityLogRecord,
-  ObservabilitySpan,
-  ObservabilityStorageAdapter,
+import {
+  type LogFilter,
+  type ObservabilityLogRecord,
+  type ObservabilitySpan,
+  type ObservabilityStorageAdapter,
+  readableLogRecordToObservabilityLog,
 } from "../types";
 
 /**
@@ -20,6 +21,7 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
   private spans: Map<string, ObservabilitySpan> = new Map();
   private traceIndex: Map<string, Set<string>> = new Map();
   private entityTraceIndex: Map<string, Set<string>> = new Map(); // Map of entityId to traceIds
+  private entityTypeTraceIndex: Map<string, Set<string>> = new Map(); // Map of entity.type to traceIds
   private logs: ObservabilityLogRecord[] = [];
   private logTraceIndex: Map<string, ObservabilityLogRecord[]> = new Map();
   private logSpanIndex: Map<string, ObservabilityLogRecord[]> = new Map();
@@ -53,18 +55,18 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
     this.spans.set(span.spanId, span);
 
     // Update trace index
-    if (!this.traceIndex.has(span.traceId)) {
-      this.traceIndex.set(span.traceId, new Set());
-    }
-    this.traceIndex.get(span.traceId)?.add(span.spanId);
+    this.addToSpanIndex(this.traceIndex, span.traceId, span.spanId);
 
     // Update entity trace index if entity.id exists
     const entityId = span.attributes?.["entity.id"] as string;
     if (entityId) {
-      if (!this.entityTraceIndex.has(entityId)) {
-        this.entityTraceIndex.set(entityId, new Set());
-      }
-      this.entityTraceIndex.get(entityId)?.add(span.traceId);
+      this.addToSpanIndex(this.entityTraceIndex, entityId, span.traceId);
+    }
+
+    // Update entity type trace index if entity.type exists
+    const entityType = span.attributes?.["entity.type"] as string;
+    if (entityType) {
+      this.addToSpanIndex(this.entityTypeTraceIndex, entityType, span.traceId);
     }
 
     // Cleanup if we exceed max spans
@@ -110,12 +112,11 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
       }
     }
 
-    // Sort by start time
-    return spans.sort((a, b) => {
-      const aTime = new Date(a.startTime).getTime();
-      const bTime = new Date(b.startTime).getTime();
-      return aTime - bTime;
-    });
+    // Sort by start time; the ISO-8601 strings order lexicographically, so
+    // comparing them directly avoids two Date parses per comparison
+    return spans.sort((a, b) =>
+      a.startTime < b.startTime ? -1 : a.startTime > b.startTime ? 1 : 0,
+    );
   }
 
   /**
@@ -124,9 +125,12 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
   async deleteOldSpans(beforeTimestamp: number): Promise<number> {
     let deletedCount = 0;
 
+    // Convert the threshold to ISO once; span start times are ISO-8601 strings
+    // and order lexicographically, so each span compares without a Date parse
+    const beforeIso = new Date(beforeTimestamp).toISOString();
+
     for (const [spanId, span] of this.spans) {
-      const spanTime = new Date(span.startTime).getTime();
-      if (spanTime < beforeTimestamp) {
+      if (span.startTime < beforeIso) {
         // Remove from spans map
         this.spans.delete(spanId);
 
@@ -148,6 +152,18 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
                 }
               }
             }
+
+            // Also remove from entity type trace index
+            const entityType = span.attributes?.["entity.type"] as string;
+            if (entityType) {
+              const typeTraces = this.entityTypeTraceIndex.get(entityType);
+              if (typeTraces) {
+                typeTraces.delete(span.traceId);
+                if (typeTraces.size === 0) {
+                  this.entityTypeTraceIndex.delete(entityType);
+                }
+              }
+            }
           }
         }
 
@@ -166,13 +182,12 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
       return; // No cleanup needed
     }
 
-    // Delete oldest 20% of spans
+    // Delete oldest 20% of spans; lexicographic order on the ISO-8601 start
+    // times matches chronological order, so no Date parsing in the comparator
     const spansToDelete = Math.floor(this.maxSpans * 0.2);
-    const sortedSpans = Array.from(this.spans.values()).sort((a, b) => {
-      const aTime = new Date(a.startTime).getTime();
-      const bTime = new Date(b.startTime).getTime();
-      return aTime - bTime;
-    });
+    const sortedSpans = Array.from(this.spans.values()).sort((a, b) =>
+      a.startTime < b.startTime ? -1 : a.startTime > b.startTime ? 1 : 0,
+    );
 
     for (let i = 0; i < spansToDelete && i < sortedSpans.length; i++) {
       const span = sortedSpans[i];
@@ -195,6 +210,7 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
     this.spans.clear();
     this.traceIndex.clear();
     this.entityTraceIndex.clear();
+    this.entityTypeTraceIndex.clear();
     this.logs = [];
     this.logTraceIndex.clear();
     this.logSpanIndex.clear();
@@ -229,14 +245,9 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
       const entityTraces = this.entityTraceIndex.get(filter.entityId);
       traceIds = entityTraces ? Array.from(entityTraces) : [];
     } else if (filter?.entityType) {
-      // Filter by entity type
-      const matchingTraces = new Set<string>();
-      for (const [, span] of this.spans) {
-        if (span.attributes?.["entity.type"] === filter.entityType) {
-          matchingTraces.add(span.traceId);
-        }
-      }
-      traceIds = Array.from(matchingTraces);
+      // Filter by entity type via the index instead of scanning every span
+      const typeTraces = this.entityTypeTraceIndex.get(filter.entityType);
+      traceIds = typeTraces ? Array.from(typeTraces) : [];
     } else {
       // Return all traces
       traceIds = Array.from(this.traceIndex.keys());
@@ -256,7 +267,6 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
    */
   async saveLogRecord(logRecord: any): Promise<void> {
     // Convert ReadableLogRecord to ObservabilityLogRecord
-    const { readableLogRecordToObservabilityLog } = await import("../types");
     const log = readableLogRecordToObservabilityLog(logRecord);
 
     // Store log
@@ -264,18 +274,12 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
 
     // Index by trace ID
     if (log.traceId) {
-      if (!this.logTraceIndex.has(log.traceId)) {
-        this.logTraceIndex.set(log.traceId, []);
-      }
-      this.logTraceIndex.get(log.traceId)?.push(log);
+      this.appendToLogIndex(this.logTraceIndex, log.traceId, log);
     }
 
     // Index by span ID
     if (log.spanId) {
-      if (!this.logSpanIndex.has(log.spanId)) {
-        this.logSpanIndex.set(log.spanId, []);
-      }
-      this.logSpanIndex.get(log.spanId)?.push(log);
+      this.appendToLogIndex(this.logSpanIndex, log.spanId, log);
     }
 
     // Cleanup if we exceed max logs
@@ -302,44 +306,33 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
    * Query logs with filters
    */
   async queryLogs(filter: LogFilter): Promise<ObservabilityLogRecord[]> {
-    let results = [...this.logs];
+    // Single pass over the store; the chained-filter version copied the whole
+    // log array once per active filter, which adds up with maxLogs at 50k
+    const results: ObservabilityLogRecord[] = [];
 
-    if (filter.traceId) {
-      results = results.filter((log) => log.traceId === filter.traceId);
-    }
-
-    if (filter.spanId) {
-      results = results.filter((log) => log.spanId === filter.spanId);
-    }
-
-    if (filter.severityNumber !== undefined) {
-      results = results.filter((log) => log.severityNumber === filter.severityNumber);
-    }
-
-    if (filter.severityText) {
-      results = results.filter((log) => log.severityText === filter.severityText);
-    }
-
-    if (filter.startTimeMin !== undefined) {
-      const minTime = filter.startTimeMin;
-      results = results.filter((log) => new Date(log.timestamp).getTime() >= minTime);
-    }
+    for (const log of this.logs) {
+      if (filter.traceId && log.traceId !== filter.traceId) continue;
+      if (filter.spanId && log.spanId !== filter.spanId) continue;
+      if (filter.severityNumber !== undefined && log.severityNumber !== filter.severityNumber) {
+        continue;
+      }
+      if (filter.severityText && log.severityText !== filter.severityText) continue;
 
-    if (filter.startTimeMax !== undefined) {
-      const maxTime = filter.startTimeMax;
-      results = results.filter((log) => new Date(log.timestamp).getTime() <= maxTime);
-    }
+      if (filter.startTimeMin !== undefined || filter.startTimeMax !== undefined) {
+        const logTime = new Date(log.timestamp).getTime();
+        if (filter.startTimeMin !== undefined && logTime < filter.startTimeMin) continue;
+        if (filter.startTimeMax !== undefined && logTime > filter.startTimeMax) continue;
+      }
 
-    if (filter.bodyContains) {
-      const searchStr = filter.bodyContains;
-      results = results.filter((log) => {
+      if (filter.bodyContains) {
         const bodyStr = typeof log.body === "string" ? log.body : safeStringify(log.body);
-        return bodyStr.includes(searchStr);
-      });
-    }
+        if (!bodyStr.includes(filter.bodyContains)) continue;
+      }
 
-    if (filter.limit) {
-      results = results.slice(0, filter.limit);
+      results.push(log);
+      if (filter.limit && results.length >= filter.limit) {
+        break;
+      }
     }
 
     return results;
@@ -353,10 +346,14 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
 
     this.logs = this.logs.filter((log) => new Date(log.timestamp).getTime() >= beforeTimestamp);
 
-    // Rebuild indexes
-    this.rebuildLogIndexes();
+    const deletedCount = initialCount - this.logs.length;
 
-    return initialCount - this.logs.length;
+    // Rebuild indexes only when the sweep actually removed something
+    if (deletedCount > 0) {
+      this.rebuildLogIndexes();
+    }
+
+    return deletedCount;
   }
 
   /**
@@ -384,21 +381,43 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
 
     for (const log of this.logs) {
       if (log.traceId) {
-        if (!this.logTraceIndex.has(log.traceId)) {
-          this.logTraceIndex.set(log.traceId, []);
-        }
-        this.logTraceIndex.get(log.traceId)?.push(log);
+        this.appendToLogIndex(this.logTraceIndex, log.traceId, log);
       }
 
       if (log.spanId) {
-        if (!this.logSpanIndex.has(log.spanId)) {
-          this.logSpanIndex.set(log.spanId, []);
-        }
-        this.logSpanIndex.get(log.spanId)?.push(log);
+        this.appendToLogIndex(this.logSpanIndex, log.spanId, log);
       }
     }
   }
 
+  /**
+   * Add a value to a span index bucket with a single map lookup
+   */
+  private addToSpanIndex(index: Map<string, Set<string>>, key: string, value: string): void {
+    const bucket = index.get(key);
+    if (bucket) {
+      bucket.add(value);
+    } else {
+      index.set(key, new Set([value]));
+    }
+  }
+
+  /**
+   * Append a log to an index bucket with a single map lookup
+   */
+  private appendToLogIndex(
+    index: Map<string, ObservabilityLogRecord[]>,
+    key: string,
+    log: ObservabilityLogRecord,
+  ): void {
+    const bucket = index.get(key);
+    if (bucket) {
+      bucket.push(log);
+    } else {
+      index.set(key, [log]);
+    }
+  }
+
   /**
    * Get statistics
    */
@@ -417,17 +436,31 @@ export class InMemoryStorageAdapter implements ObservabilityStorageAdapter {
       logCount: this.logs.length,
     };
 
+    // Track min/max in one pass; spreading tens of thousands of timestamps
+    // into Math.min/Math.max allocates an intermediate array and can overflow
+    // the argument stack at the default maxSpans/maxLogs sizes
     if (this.spans.size > 0) {
-      const spans = Array.from(this.spans.values());
-      const times = spans.map((s) => new Date(s.startTime).getTime());
-      stats.oldestSpan = new Date(Math.min(...times));
-      stats.newestSpan = new Date(Math.max(...times));
+      let oldest = Number.POSITIVE_INFINITY;
+      let newest = Number.NEGATIVE_INFINITY;
+      for (const span of this.spans.values()) {
+        const time = new Date(span.startTime).getTime();
+        if (time < oldest) oldest = time;
+        if (time > newest) newest = time;
+      }
+      stats.oldestSpan = new Date(oldest);
+      stats.newestSpan = new Date(newest);
     }
 
     if (this.logs.length > 0) {
-      const times = this.logs.map((l) => new Date(l.timestamp).getTime());
-      stats.oldestLog = new Date(Math.min(...times));
-      stats.newestLog = new Date(Math.max(...times));
+      let oldest = Number.POSITIVE_INFINITY;
+      let newest = Number.NEGATIVE_INFINITY;
+      for (const log of this.logs) {
+        const time = new Date(log.timestamp).getTime();
+        if (time < oldest) oldest = time;
+        if (time > newest) newest = time;
+      }
+      stats.oldestLog = new Date(oldest);
+      stats.newestLog = new Date(newest);
     }
 
     return stats;
@@ -25,6 +25,9 @@ export class LazyRemoteExportProcessor implements SpanProcessor {
   private config: LazyRemoteExportConfig;
   private actualProcessor?: BatchSpanProcessor;
   private pendingSpans: ReadableSpan[] = [];
+  /** Index of the oldest live pending span; entries before it are already dropped */
+  private pendingSpansHead = 0;
+  private static readonly MAX_PENDING_SPANS = 1000;
   private initialized = false;
   private initCheckInterval?: NodeJS.Timeout;
   private logger?: Logger;
@@ -61,9 +64,16 @@ export class LazyRemoteExportProcessor implements SpanProcessor {
       // Store spans until we can initialize
       this.pendingSpans.push(span);
 
-      // Limit pending spans to prevent memory issues
-      if (this.pendingSpans.length > 1000) {
-        this.pendingSpans.shift(); // Remove oldest
+      // Limit pending spans to prevent memory issues; dropping the oldest by
+      // advancing a head cursor and compacting once per full window keeps the
+      // overflow path O(1) amortized, where shift() re-indexed the array per span
+      const pendingCount = this.pendingSpans.length - this.pendingSpansHead;
+      if (pendingCount > LazyRemoteExportProcessor.MAX_PENDING_SPANS) {
+        this.pendingSpansHead += 1;
+        if (this.pendingSpansHead >= LazyRemoteExportProcessor.MAX_PENDING_SPANS) {
+          this.pendingSpans = this.pendingSpans.slice(this.pendingSpansHead);
+          this.pendingSpansHead = 0;
+        }
       }
     }
   }
@@ -93,6 +103,7 @@ export class LazyRemoteExportProcessor implements SpanProcessor {
     }
 
     this.pendingSpans = [];
+    this.pendingSpansHead = 0;
   }
 
   /**
@@ -157,16 +168,16 @@ export class LazyRemoteExportProcessor implements SpanProcessor {
       });
 
       // Process pending spans
-      if (this.pendingSpans.length > 0) {
-        for (const span of this.pendingSpans) {
-          this.actualProcessor.onEnd(span);
+      const pendingCount = this.pendingSpans.length - this.pendingSpansHead;
+      if (pendingCount > 0) {
+        for (let i = this.pendingSpansHead; i < this.pendingSpans.length; i++) {
+          this.actualProcessor.onEnd(this.pendingSpans[i]);
         }
 
-        this.logger?.debug(
-          `[LazyRemoteExport] Processed ${this.pendingSpans.length} pending spans`,
-        );
+        this.logger?.debug(`[LazyRemoteExport] Processed ${pendingCount} pending spans`);
 
         this.pendingSpans = [];
+        this.pendingSpansHead = 0;
       }
 
       this.initialized = true;
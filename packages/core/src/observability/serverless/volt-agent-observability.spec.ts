@@ -0,0 +1,74 @@
+import { ExportResultCode } from "@opentelemetry/core";
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import { FetchTraceExporter } from "./volt-agent-observability";
+
+describe("FetchTraceExporter retry policy", () => {
+  const endpoint = { url: "https://collector.example.com/v1/traces" };
+  let fetchMock: ReturnType<typeof vi.fn>;
+  let warnSpy: ReturnType<typeof vi.spyOn>;
+  let errorSpy: ReturnType<typeof vi.spyOn>;
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    fetchMock = vi.fn();
+    vi.stubGlobal("fetch", fetchMock);
+    warnSpy = vi.spyOn(console, "warn").mockImplementation(() => {});
+    errorSpy = vi.spyOn(console, "error").mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.useRealTimers();
+    warnSpy.mockRestore();
+    errorSpy.mockRestore();
+  });
+
+  const exportSpans = () => {
+    const exporter = new FetchTraceExporter(endpoint);
+    const resultCallback = vi.fn();
+    exporter.export([], resultCallback);
+    return resultCallback;
+  };
+
+  it("should retry a 429 and honor the Retry-After header", async () => {
+    fetchMock
+      .mockResolvedValueOnce(new Response(null, { status: 429, headers: { "retry-after": "1" } }))
+      .mockResolvedValueOnce(new Response(null, { status: 200 }));
+
+    const resultCallback = exportSpans();
+    await vi.runAllTimersAsync();
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(warnSpy).toHaveBeenCalledWith(
+      "[ServerlessTraceExporter] retrying export",
+      expect.objectContaining({ delayMs: 1000 }),
+    );
+    expect(resultCallback).toHaveBeenCalledWith({ code: ExportResultCode.SUCCESS });
+  });
+
+  it("should not retry a non-retryable client error", async () => {
+    fetchMock.mockResolvedValue(new Response(null, { status: 400 }));
+
+    const resultCallback = exportSpans();
+    await vi.runAllTimersAsync();
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(resultCallback).toHaveBeenCalledWith({
+      code: ExportResultCode.FAILED,
+      error: expect.any(Error),
+    });
+  });
+
+  it("should retry network errors until the attempt budget is exhausted", async () => {
+    fetchMock.mockRejectedValue(new Error("connection reset"));
+
+    const resultCallback = exportSpans();
+    await vi.runAllTimersAsync();
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+    expect(resultCallback).toHaveBeenCalledWith({
+      code: ExportResultCode.FAILED,
+      error: expect.any(Error),
+    });
+  });
+});
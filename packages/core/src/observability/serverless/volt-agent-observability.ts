@@ -40,17 +40,37 @@ import type {
   ServerlessRemoteExportConfig,
 } from "../types";
 
-const textDecoder = typeof TextDecoder !== "undefined" ? new TextDecoder() : undefined;
-
 const isPromiseLike = (value: unknown): value is PromiseLike<unknown> =>
   typeof value === "object" && value !== null && typeof (value as any).then === "function";
 
 const DEFAULT_MAX_ATTEMPTS = 3;
 const INITIAL_RETRY_DELAY_MS = 500;
 const RETRY_BACKOFF_FACTOR = 2;
+const MAX_RETRY_DELAY_MS = 30_000;
 
 const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
+// Timeouts, rate limits and server errors are worth retrying; other client
+// errors (bad auth, malformed payload) will fail identically on every attempt
+const isRetryableStatus = (status: number): boolean =>
+  status === 408 || status === 429 || status >= 500;
+
+// Prefer the server's Retry-After (seconds or HTTP date) over our own backoff
+const retryDelayFromResponse = (response: Response, fallbackMs: number): number => {
+  const retryAfter = response.headers.get("retry-after");
+  if (retryAfter) {
+    const seconds = Number(retryAfter);
+    if (Number.isFinite(seconds) && seconds >= 0) {
+      return Math.min(seconds * 1000, MAX_RETRY_DELAY_MS);
+    }
+    const untilDateMs = Date.parse(retryAfter) - Date.now();
+    if (Number.isFinite(untilDateMs) && untilDateMs > 0) {
+      return Math.min(untilDateMs, MAX_RETRY_DELAY_MS);
+    }
+  }
+  return Math.min(fallbackMs, MAX_RETRY_DELAY_MS);
+};
+
 type ObservabilityGlobals = typeof globalThis & {
   ___voltagent_otel_logger_provider?: LoggerProvider;
   ___voltagent_otel_api?: { trace: typeof trace; context: typeof context };
@@ -554,7 +574,8 @@ function createRemoteLogProcessor(
   return new SimpleLogRecordProcessor(exporter);
 }
 
-class FetchTraceExporter {
+// Exported for the retry-policy spec; not part of the public surface
+export class FetchTraceExporter {
   constructor(private endpoint: ServerlessRemoteEndpointConfig) {}
 
   export(items: ReadableSpan[], resultCallback: (result: any) => void): void {
@@ -564,8 +585,9 @@ class FetchTraceExporter {
     }
 
     try {
-      const payloadBytes = JsonTraceSerializer.serializeRequest(items);
-      const body = (textDecoder ?? new TextDecoder()).decode(payloadBytes);
+      // Send the serialized bytes as-is; decoding to a string only forces
+      // fetch to re-encode the same payload.
+      const body = JsonTraceSerializer.serializeRequest(items);
 
       const performExport = async () => {
         let attempt = 0;
@@ -573,6 +595,7 @@ class FetchTraceExporter {
 
         while (attempt < DEFAULT_MAX_ATTEMPTS) {
           attempt += 1;
+          let retryAfterMs: number | undefined;
           try {
             const response = await fetch(this.endpoint.url, {
               method: this.endpoint.method ?? "POST",
@@ -583,12 +606,20 @@ class FetchTraceExporter {
               body,
             });
 
-            if (!response.ok) {
-              throw new Error(`HTTP ${response.status}`);
+            if (response.ok) {
+              resultCallback({ code: ExportResultCode.SUCCESS });
+              return;
+            }
+
+            if (!isRetryableStatus(response.status)) {
+              const error = new Error(`HTTP ${response.status}`);
+              console.error("[ServerlessTraceExporter] export error", error);
+              resultCallback({ code: ExportResultCode.FAILED, error });
+              return;
             }
 
-            resultCallback({ code: ExportResultCode.SUCCESS });
-            return;
+            retryAfterMs = retryDelayFromResponse(response, delayMs);
+            throw new Error(`HTTP ${response.status}`);
           } catch (error) {
             if (attempt >= DEFAULT_MAX_ATTEMPTS) {
               console.error("[ServerlessTraceExporter] export error", error);
@@ -599,13 +630,14 @@ class FetchTraceExporter {
               return;
             }
 
+            const waitMs = retryAfterMs ?? delayMs;
             console.warn("[ServerlessTraceExporter] retrying export", {
               attempt,
-              delayMs,
+              delayMs: waitMs,
               error: error instanceof Error ? error.message : String(error),
             });
-            await sleep(delayMs);
-            delayMs *= RETRY_BACKOFF_FACTOR;
+            await sleep(waitMs);
+            delayMs = Math.min(waitMs * RETRY_BACKOFF_FACTOR, MAX_RETRY_DELAY_MS);
           }
         }
       };
@@ -639,8 +671,9 @@ class FetchLogExporter {
     }
 
     try {
-      const payloadBytes = JsonLogsSerializer.serializeRequest(items);
-      const body = (textDecoder ?? new TextDecoder()).decode(payloadBytes);
+      // Send the serialized bytes as-is; decoding to a string only forces
+      // fetch to re-encode the same payload.
+      const body = JsonLogsSerializer.serializeRequest(items);
 
       const performExport = async () => {
         let attempt = 0;
@@ -648,6 +681,7 @@ class FetchLogExporter {
 
         while (attempt < DEFAULT_MAX_ATTEMPTS) {
           attempt += 1;
+          let retryAfterMs: number | undefined;
           try {
             const response = await fetch(this.endpoint.url, {
               method: this.endpoint.method ?? "POST",
@@ -658,12 +692,20 @@ class FetchLogExporter {
               body,
             });
 
-            if (!response.ok) {
-              throw new Error(`HTTP ${response.status}`);
+            if (response.ok) {
+              resultCallback({ code: ExportResultCode.SUCCESS });
+              return;
+            }
+
+            if (!isRetryableStatus(response.status)) {
+              const error = new Error(`HTTP ${response.status}`);
+              console.error("[ServerlessLogExporter] export error", error);
+              resultCallback({ code: ExportResultCode.FAILED, error });
+              return;
             }
 
-            resultCallback({ code: ExportResultCode.SUCCESS });
-            return;
+            retryAfterMs = retryDelayFromResponse(response, delayMs);
+            throw new Error(`HTTP ${response.status}`);
           } catch (error) {
             if (attempt >= DEFAULT_MAX_ATTEMPTS) {
               console.error("[ServerlessLogExporter] export error", error);
@@ -674,13 +716,14 @@ class FetchLogExporter {
               return;
             }
 
+            const waitMs = retryAfterMs ?? delayMs;
             console.warn("[ServerlessLogExporter] retrying export", {
               attempt,
-              delayMs,
+              delayMs: waitMs,
               error: error instanceof Error ? error.message : String(error),
             });
-            await sleep(delayMs);
-            delayMs *= RETRY_BACKOFF_FACTOR;
+            await sleep(waitMs);
+            delayMs = Math.min(waitMs * RETRY_BACKOFF_FACTOR, MAX_RETRY_DELAY_MS);
           }
         }
       };
@@ -152,9 +152,15 @@ export function createPlanningToolkit(agent: Agent, options: PlanningToolkitOpti
         ((executeOptions as any).parentToolSpan as Span | undefined) ||
         (operationContext.systemContext.get("parentToolSpan") as Span | undefined);
       if (toolSpan) {
-        const pendingCount = guardedTodos.filter((todo) => todo.status === "pending").length;
-        const inProgressCount = guardedTodos.filter((todo) => todo.status === "in_progress").length;
-        const doneCount = guardedTodos.filter((todo) => todo.status === "done").length;
+        // Tally all three statuses in one pass instead of filtering three times
+        let pendingCount = 0;
+        let inProgressCount = 0;
+        let doneCount = 0;
+        for (const todo of guardedTodos) {
+          if (todo.status === "pending") pendingCount += 1;
+          else if (todo.status === "in_progress") inProgressCount += 1;
+          else if (todo.status === "done") doneCount += 1;
+        }
         const snapshot = buildTodoTraceSnapshot(guardedTodos);
 
         toolSpan.setAttribute("voltagent.label", "write_todos");
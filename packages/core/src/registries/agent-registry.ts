@@ -89,11 +89,12 @@ export class AgentRegistry {
    * @param childId ID of the child agent (sub-agent)
    */
   public registerSubAgent(parentId: string, childId: string): void {
-    if (!this.agentRelationships.has(childId)) {
-      this.agentRelationships.set(childId, []);
+    // Resolve the bucket with a single map lookup
+    let parents = this.agentRelationships.get(childId);
+    if (!parents) {
+      parents = [];
+      this.agentRelationships.set(childId, parents);
     }
-
-    const parents = this.agentRelationships.get(childId) ?? [];
     if (!parents.includes(parentId)) {
       parents.push(parentId);
     }
@@ -105,8 +106,8 @@ export class AgentRegistry {
    * @param childId ID of the child agent
    */
   public unregisterSubAgent(parentId: string, childId: string): void {
-    if (this.agentRelationships.has(childId)) {
-      const parents = this.agentRelationships.get(childId) ?? [];
+    const parents = this.agentRelationships.get(childId);
+    if (parents) {
       const index = parents.indexOf(parentId);
       if (index !== -1) {
         parents.splice(index, 1);
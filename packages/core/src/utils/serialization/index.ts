@@ -1,5 +1,3 @@
-import { deepClone } from "@voltagent/internal";
-
 /**
  * Safely parse JSON string. If parsing fails, returns the original value.
  * @param value String to parse as JSON
@@ -17,6 +15,10 @@ export function safeJsonParse(value: string | null | undefined): any {
 
 // Helper function to safely serialize complex values for debugging
 export function serializeValueForDebug(value: unknown): unknown {
+  return serializeValueForDebugInternal(value, new WeakSet());
+}
+
+function serializeValueForDebugInternal(value: unknown, ancestors: WeakSet<object>): unknown {
   if (value === null || value === undefined) {
     return value;
   }
@@ -44,23 +46,42 @@ export function serializeValueForDebug(value: unknown): unknown {
     if (value instanceof Set) {
       return `[Set size=${value.size}]`; // Avoid serializing potentially complex Set values
     }
+
+    // Track the current recursion path so self-referencing structures come
+    // back as "[Circular]" instead of overflowing the stack. The entry is
+    // removed on the way out, so shared (non-cyclic) references still
+    // serialize normally.
+    const objectValue = value as object;
+    if (ancestors.has(objectValue)) {
+      return "[Circular]";
+    }
+
     if (Array.isArray(value)) {
       // For arrays, serialize elements recursively, but keep it as an array
-      // Limit depth or size if needed to prevent large payloads
-      return value.map(serializeValueForDebug);
+      ancestors.add(objectValue);
+      const result = value.map((item) => serializeValueForDebugInternal(item, ancestors));
+      ancestors.delete(objectValue);
+      return result;
     }
-    // For plain objects, try to serialize, but handle potential errors
+
+    // Plain objects can still throw during enumeration (e.g. a hostile
+    // getter); this is a debug path, so report the failure instead of throwing
     try {
       // Basic check for prototype to differentiate plain objects from class instances
       if (Object.getPrototypeOf(value) === Object.prototype) {
-        // Attempt to stringify/parse to handle simple cases, could use a more robust method
-        // This basic version might still fail on circular refs within plain objects
-        // Consider a library or depth limiting for robustness
-        return deepClone(value);
+        ancestors.add(objectValue);
+        const result: Record<string, unknown> = {};
+        for (const [key, entryValue] of Object.entries(value)) {
+          result[key] = serializeValueForDebugInternal(entryValue, ancestors);
+        }
+        ancestors.delete(objectValue);
+        return result;
       }
+
       // For class instances
       return `[Object: ${value.constructor?.name || "UnknownClass"}]`;
     } catch (e) {
+      ancestors.delete(objectValue);
       return `[SerializationError: ${e instanceof Error ? e.message : "Unknown"}]`;
     }
   }
@@ -6,6 +6,18 @@ import { safeStringify } from "@voltagent/internal/utils";
 import { LoggerProxy } from "../../logger";
 import type { PackageUpdateInfo } from "./index";
 
+/**
+ * One-shot digest helper. `crypto.hash` (Node 20.12+) avoids allocating a
+ * streaming Hash object for these small fingerprint inputs; fall back to the
+ * classic API on older runtimes.
+ */
+const digestHex = (algorithm: string, content: string): string => {
+  if (typeof (crypto as any).hash === "function") {
+    return (crypto as any).hash(algorithm, content) as string;
+  }
+  return crypto.createHash(algorithm).update(content).digest("hex");
+};
+
 /**
  * Cache structure for update checks
  */
@@ -71,11 +83,7 @@ export const getCacheFilePath = (projectPath: string): string => {
   const normalizedPath = path.resolve(projectPath);
 
   // Use SHA-256 for better future-proofing
-  const projectHash = crypto
-    .createHash("sha256")
-    .update(normalizedPath)
-    .digest("hex")
-    .substring(0, 12); // 12 chars is enough for uniqueness
+  const projectHash = digestHex("sha256", normalizedPath).substring(0, 12); // 12 chars is enough for uniqueness
 
   const cacheDir = getSystemCacheDir();
   return path.join(cacheDir, `update-check-${projectHash}.json`);
@@ -97,7 +105,7 @@ export const ensureCacheDir = (): void => {
 export const getPackageJsonHash = (packageJsonPath: string): string => {
   try {
     const content = fs.readFileSync(packageJsonPath, "utf8");
-    return crypto.createHash("md5").update(content).digest("hex");
+    return digestHex("md5", content);
   } catch (error) {
     const logger = new LoggerProxy({ component: "update-cache" });
     logger.error("Error reading package.json for hash", { error });
@@ -112,15 +120,16 @@ export const readUpdateCache = async (projectPath: string): Promise<UpdateCache
   try {
     const cacheFilePath = getCacheFilePath(projectPath);
 
-    if (!fs.existsSync(cacheFilePath)) {
-      return null;
-    }
-
-    const cacheContent = fs.readFileSync(cacheFilePath, "utf8");
+    // Read directly and treat a missing file as a cache miss; this avoids a
+    // separate existence probe and keeps the I/O off the event loop
+    const cacheContent = await fs.promises.readFile(cacheFilePath, "utf8");
     const cache = JSON.parse(cacheContent) as UpdateCache;
 
     return cache;
   } catch (error) {
+    if ((error as NodeJS.ErrnoException)?.code === "ENOENT") {
+      return null;
+    }
     const logger = new LoggerProxy({ component: "update-cache" });
     logger.error("Error reading update cache", { error });
     return null;
@@ -132,10 +141,12 @@ export const readUpdateCache = async (projectPath: string): Promise<UpdateCache
  */
 export const writeUpdateCache = async (projectPath: string, cache: UpdateCache): Promise<void> => {
   try {
-    ensureCacheDir();
+    await fs.promises.mkdir(getSystemCacheDir(), { recursive: true });
     const cacheFilePath = getCacheFilePath(projectPath);
 
-    fs.writeFileSync(cacheFilePath, safeStringify(cache, { indentation: 2 }), "utf8");
+    // Compact output: only readUpdateCache ever parses this file, so the
+    // pretty-printing bytes were pure serialization and disk overhead
+    await fs.promises.writeFile(cacheFilePath, safeStringify(cache), "utf8");
   } catch (error) {
     const logger = new LoggerProxy({ component: "update-cache" });
     logger.error("Error writing update cache", { error });
@@ -175,10 +186,11 @@ export const clearUpdateCache = async (projectPath: string): Promise<void> => {
   try {
     const cacheFilePath = getCacheFilePath(projectPath);
 
-    if (fs.existsSync(cacheFilePath)) {
-      fs.unlinkSync(cacheFilePath);
-    }
+    await fs.promises.unlink(cacheFilePath);
   } catch (error) {
+    if ((error as NodeJS.ErrnoException)?.code === "ENOENT") {
+      return;
+    }
     const logger = new LoggerProxy({ component: "update-cache" });
     logger.error("Error clearing update cache", { error });
   }
@@ -121,7 +121,8 @@ const resolveCandidatePaths = async (
     throw new LocalPromptNotFoundError(`Prompt path escapes base directory: ${promptName}`);
   }
 
-  if (fs.existsSync(baseFilePath) && fs.statSync(baseFilePath).isFile()) {
+  // A single stat answers both existence and type; existsSync would double the syscalls
+  if (fs.statSync(baseFilePath, { throwIfNoEntry: false })?.isFile()) {
     candidatePaths.push(baseFilePath);
   }
 
@@ -130,7 +131,7 @@ const resolveCandidatePaths = async (
     throw new LocalPromptNotFoundError(`Prompt path escapes base directory: ${promptName}`);
   }
 
-  if (fs.existsSync(dirPath) && fs.statSync(dirPath).isDirectory()) {
+  if (fs.statSync(dirPath, { throwIfNoEntry: false })?.isDirectory()) {
     const entries = await fs.promises.readdir(dirPath, { withFileTypes: true });
     for (const entry of entries) {
       if (!entry.isFile() || !entry.name.toLowerCase().endsWith(".md")) {
@@ -285,9 +286,15 @@ export const createLocalPromptHelper = (options?: {
           throw new LocalPromptNotFoundError(`Local prompt not found: ${reference.promptName}`);
         }
 
+        // Read the candidate files concurrently; a versioned prompt directory
+        // holds one file per version and sequential awaits serialize the I/O
+        // latency of each read. Promise.all keeps the results in path order.
+        const parsedFiles = await Promise.all(
+          candidatePaths.map((filePath) => parsePromptFile(filePath, normalizedName)),
+        );
+
         const candidates: ParsedPromptFile[] = [];
-        for (const filePath of candidatePaths) {
-          const parsedFile = await parsePromptFile(filePath, normalizedName);
+        for (const parsedFile of parsedFiles) {
           if (parsedFile.metadata.name && parsedFile.metadata.name !== normalizedName) {
             continue;
           }
@@ -643,6 +643,34 @@ describe("VoltOpsPromptManagerImpl", () => {
       expect(mockApiClient.fetchPrompt).toHaveBeenCalledTimes(1);
     });
 
+    it("should cache different labels of the same prompt separately", async () => {
+      mockApiClient.fetchPrompt.mockImplementation(async (reference: PromptReference) => ({
+        prompt: {
+          type: "text",
+          text: `Hello from ${reference.label}!`,
+        },
+        type: "text",
+        name: "test-prompt",
+        version: "latest",
+      }));
+
+      const production: PromptReference = { promptName: "test-prompt", label: "production" };
+      const staging: PromptReference = { promptName: "test-prompt", label: "staging" };
+
+      const first = await manager.getPrompt(production);
+      const second = await manager.getPrompt(staging);
+
+      // Each label misses the cache and fetches its own variant
+      expect(mockApiClient.fetchPrompt).toHaveBeenCalledTimes(2);
+      expect(first.text).toBe("Hello from production!");
+      expect(second.text).toBe("Hello from staging!");
+
+      // Repeat calls hit the per-label cache entries without refetching
+      await manager.getPrompt(production);
+      await manager.getPrompt(staging);
+      expect(mockApiClient.fetchPrompt).toHaveBeenCalledTimes(2);
+    });
+
     it("should handle specific version requests", async () => {
       const request: PromptReference = {
         promptName: "test-prompt",
@@ -203,8 +203,12 @@ export class VoltOpsPromptManagerImpl implements VoltOpsPromptManager {
    * Generate cache key for prompt reference
    */
   private getCacheKey = (reference: PromptReference): string => {
-    const { promptName, version = "latest" } = reference;
-    return `${promptName}:${version}`;
+    // Mirror the fetch semantics: a specific version wins, otherwise the label
+    // selects the variant. Keying on version alone made different labels of
+    // the same prompt collide on a single cache slot.
+    const { promptName, version, label } = reference;
+    const selector = version !== undefined ? `v${version}` : (label ?? "latest");
+    return `${promptName}:${selector}`;
   };
 
   /**
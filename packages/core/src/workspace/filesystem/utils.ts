@@ -128,7 +128,19 @@ export function performStringReplacement(
   newString: string,
   replaceAll: boolean,
 ): [string, number] | string {
-  const occurrences = content.split(oldString).length - 1;
+  if (oldString.length === 0) {
+    return `Error: String not found in file: '${oldString}'`;
+  }
+
+  // Count without split, which would allocate every segment of the file
+  let occurrences = 0;
+  for (
+    let idx = content.indexOf(oldString);
+    idx !== -1;
+    idx = content.indexOf(oldString, idx + oldString.length)
+  ) {
+    occurrences++;
+  }
 
   if (occurrences === 0) {
     return `Error: String not found in file: '${oldString}'`;
@@ -33,7 +33,10 @@ export class WorkspaceBm25Index {
   private readonly k1: number;
   private readonly b: number;
   private readonly docs = new Map<string, WorkspaceBm25Document>();
-  private readonly docFreq = new Map<string, number>();
+  // Inverted index: term -> ids of documents containing it. Queries score the
+  // union of the query terms' postings instead of scanning every document, and
+  // a term's document frequency is just its posting size.
+  private readonly postings = new Map<string, Set<string>>();
   private totalDocs = 0;
   private totalLength = 0;
 
@@ -58,10 +61,14 @@ export class WorkspaceBm25Index {
 
     const tokens = tokenize(params.content);
     const termFreq = buildTermFreq(tokens);
-    const uniqueTerms = new Set(termFreq.keys());
 
-    for (const term of uniqueTerms) {
-      this.docFreq.set(term, (this.docFreq.get(term) ?? 0) + 1);
+    for (const term of termFreq.keys()) {
+      const bucket = this.postings.get(term);
+      if (bucket) {
+        bucket.add(params.id);
+      } else {
+        this.postings.set(term, new Set([params.id]));
+      }
     }
 
     const doc: WorkspaceBm25Document = {
@@ -83,16 +90,14 @@ export class WorkspaceBm25Index {
       return;
     }
 
-    const uniqueTerms = new Set(doc.termFreq.keys());
-    for (const term of uniqueTerms) {
-      const current = this.docFreq.get(term);
-      if (!current) {
+    for (const term of doc.termFreq.keys()) {
+      const bucket = this.postings.get(term);
+      if (!bucket) {
         continue;
       }
-      if (current <= 1) {
-        this.docFreq.delete(term);
-      } else {
-        this.docFreq.set(term, current - 1);
+      bucket.delete(id);
+      if (bucket.size === 0) {
+        this.postings.delete(term);
       }
     }
 
@@ -118,7 +123,24 @@ export class WorkspaceBm25Index {
     const avgDocLength = rawAvgDocLength > 0 ? rawAvgDocLength : 1;
     const scores = new Map<string, number>();
 
-    for (const doc of this.docs.values()) {
+    // Only documents that contain at least one query term can score above
+    // zero, so gather candidates from the postings lists
+    const candidateIds = new Set<string>();
+    for (const term of queryTerms) {
+      const bucket = this.postings.get(term);
+      if (!bucket) {
+        continue;
+      }
+      for (const docId of bucket) {
+        candidateIds.add(docId);
+      }
+    }
+
+    for (const docId of candidateIds) {
+      const doc = this.docs.get(docId);
+      if (!doc) {
+        continue;
+      }
       if (options.filter && !options.filter(doc)) {
         continue;
       }
@@ -130,7 +152,7 @@ export class WorkspaceBm25Index {
           continue;
         }
 
-        const df = this.docFreq.get(term) ?? 0;
+        const df = this.postings.get(term)?.size ?? 0;
         if (df === 0) {
           continue;
         }
@@ -125,28 +125,56 @@ const normalizeDocumentPath = (value: string): string => {
   return trimmed.startsWith("/") ? trimmed : `/${trimmed}`;
 };
 
-const matchesPathFilter = (docPath: string, basePath: string | null, glob?: string): boolean => {
+// Compiled glob matchers cached per pattern so repeated queries with the
+// same glob skip the micromatch parse; bounded with LRU eviction
+const MAX_GLOB_MATCHER_CACHE_ENTRIES = 64;
+const globMatcherCache = new Map<string, (relativePath: string) => boolean>();
+
+const getGlobMatcher = (glob: string): ((relativePath: string) => boolean) => {
+  const cached = globMatcherCache.get(glob);
+  if (cached) {
+    // Re-insert to refresh recency (Map preserves insertion order)
+    globMatcherCache.delete(glob);
+    globMatcherCache.set(glob, cached);
+    return cached;
+  }
+
+  const matcher = micromatch.matcher(glob, { dot: true, nobrace: false });
+  if (globMatcherCache.size >= MAX_GLOB_MATCHER_CACHE_ENTRIES) {
+    const oldestKey = globMatcherCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      globMatcherCache.delete(oldestKey);
+    }
+  }
+  globMatcherCache.set(glob, matcher);
+  return matcher;
+};
+
+const matchesPathFilter = (
+  docPath: string,
+  basePath: string | null,
+  matchGlob?: (relativePath: string) => boolean,
+): boolean => {
   if (basePath && !docPath.startsWith(basePath)) {
     return false;
   }
 
-  if (!glob) {
+  if (!matchGlob) {
     return true;
   }
 
   const relative = basePath
     ? docPath.slice(basePath.length).replace(/^\/+/, "")
     : docPath.replace(/^\/+/, "");
-  return micromatch.isMatch(relative, glob, { dot: true, nobrace: false });
+  return matchGlob(relative);
 };
 
-const buildSnippet = (content: string, query: string, length: number): string => {
+const buildSnippet = (content: string, terms: string[], length: number): string => {
   const compact = content.replace(/\s+/g, " ").trim();
   if (compact.length <= length) {
     return compact;
   }
 
-  const terms = tokenizeSearchText(query);
   const lower = compact.toLowerCase();
   for (const term of terms) {
     const idx = lower.indexOf(term);
@@ -162,21 +190,20 @@ const buildSnippet = (content: string, query: string, length: number): string =>
 
 const buildLineRange = (
   content: string,
-  query: string,
+  tokens: string[],
 ): { start: number; end: number } | undefined => {
-  const tokens = tokenizeSearchText(query);
   if (tokens.length === 0) {
     return undefined;
   }
 
-  const lowerTokens = tokens.map((token) => token.toLowerCase());
+  // Tokens come from tokenizeSearchText, which already lowercases them
   const lines = content.split("\n");
   let start: number | null = null;
   let end: number | null = null;
 
   for (let idx = 0; idx < lines.length; idx += 1) {
     const line = lines[idx].toLowerCase();
-    if (lowerTokens.some((token) => line.includes(token))) {
+    if (tokens.some((token) => line.includes(token))) {
       if (start === null) {
         start = idx + 1;
       }
@@ -193,16 +220,30 @@ const buildLineRange = (
 
 const clampScore = (value: number): number => Math.min(1, Math.max(0, value));
 
+// Read error.message once instead of testing and re-reading it per use
+const describeError = (error: any, fallback: string): string => {
+  const message = error?.message;
+  return message ? String(message) : fallback;
+};
+
+// Fill the score maps directly; new Map(scores.map(...)) allocates an
+// intermediate entry tuple per result on every query
 const normalizeScores = (scores: Array<{ id: string; score: number }>) => {
   const maxScore = scores.reduce((max, item) => Math.max(max, item.score), 0);
-  if (maxScore <= 0) {
-    return new Map(scores.map((item) => [item.id, 0]));
+  const normalized = new Map<string, number>();
+  for (const item of scores) {
+    normalized.set(item.id, maxScore > 0 ? clampScore(item.score / maxScore) : 0);
   }
-  return new Map(scores.map((item) => [item.id, clampScore(item.score / maxScore)]));
+  return normalized;
 };
 
-const clampScores = (scores: Array<{ id: string; score: number }>) =>
-  new Map(scores.map((item) => [item.id, clampScore(item.score)]));
+const clampScores = (scores: Array<{ id: string; score: number }>) => {
+  const clamped = new Map<string, number>();
+  for (const item of scores) {
+    clamped.set(item.id, clampScore(item.score));
+  }
+  return clamped;
+};
 
 export class WorkspaceSearch {
   private readonly filesystem: WorkspaceFilesystem;
@@ -316,43 +357,56 @@ export class WorkspaceSearch {
         });
       } catch (error: any) {
         summary.errors.push(
-          `Failed to glob ${basePath}: ${error?.message ? String(error.message) : "unknown error"}`,
+          `Failed to glob ${basePath}: ${describeError(error, "unknown error")}`,
         );
         continue;
       }
-      const docs: WorkspaceSearchDocument[] = [];
+      // Read matched files concurrently; the reads are independent and a
+      // serial await per file left the filesystem idle between requests
+      const readOutcomes = await Promise.all(
+        infos.map(async (info): Promise<{ doc?: WorkspaceSearchDocument; error?: string }> => {
+          if (maxFileBytes > 0 && info.size && info.size > maxFileBytes) {
+            return {};
+          }
 
-      for (const info of infos) {
-        if (maxFileBytes > 0 && info.size && info.size > maxFileBytes) {
-          summary.skipped += 1;
-          continue;
-        }
+          try {
+            const data = await this.filesystem.readRaw(info.path, {
+              context: options?.context,
+            });
+            const content = data.content.join("\n");
+            const contentBytes = Buffer.byteLength(content, "utf-8");
 
-        try {
-          const data = await this.filesystem.readRaw(info.path, {
-            context: options?.context,
-          });
-          const content = data.content.join("\n");
-          const contentBytes = Buffer.byteLength(content, "utf-8");
+            if (maxFileBytes > 0 && contentBytes > maxFileBytes) {
+              return {};
+            }
 
-          if (maxFileBytes > 0 && contentBytes > maxFileBytes) {
-            summary.skipped += 1;
-            continue;
+            return {
+              doc: {
+                id: info.path,
+                path: info.path,
+                content,
+                metadata: {
+                  size: info.size ?? contentBytes,
+                  modified_at: info.modified_at,
+                },
+              },
+            };
+          } catch (error: any) {
+            return {
+              error: `Failed to read ${info.path}: ${describeError(error, "unknown error")}`,
+            };
           }
+        }),
+      );
 
-          docs.push({
-            id: info.path,
-            path: info.path,
-            content,
-            metadata: {
-              size: info.size ?? contentBytes,
-              modified_at: info.modified_at,
-            },
-          });
-        } catch (error: any) {
-          summary.errors.push(
-            `Failed to read ${info.path}: ${error?.message ? String(error.message) : "unknown error"}`,
-          );
+      const docs: WorkspaceSearchDocument[] = [];
+      for (const outcome of readOutcomes) {
+        if (outcome.doc) {
+          docs.push(outcome.doc);
+        } else if (outcome.error) {
+          summary.errors.push(outcome.error);
+        } else {
+          summary.skipped += 1;
         }
       }
 
@@ -380,7 +434,20 @@ export class WorkspaceSearch {
       return summary;
     }
 
+    // Re-tokenize and re-embed only documents whose content actually changed;
+    // re-index runs over a mostly unchanged workspace keep their existing
+    // BM25 and vector entries
+    const changedDocs: WorkspaceSearchDocument[] = [];
     for (const doc of docs) {
+      const existing = this.documents.get(doc.id);
+      if (existing && existing.content === doc.content) {
+        this.documents.set(doc.id, doc);
+        continue;
+      }
+      changedDocs.push(doc);
+    }
+
+    for (const doc of changedDocs) {
       this.bm25.addDocument({
         id: doc.id,
         path: doc.path,
@@ -392,10 +459,10 @@ export class WorkspaceSearch {
 
     summary.indexed += docs.length;
 
-    if (this.embedding && this.vector) {
+    if (this.embedding && this.vector && changedDocs.length > 0) {
       try {
-        const embeddings = await this.embedding.embedBatch(docs.map((doc) => doc.content));
-        const items: VectorItem[] = docs.map((doc, idx) => ({
+        const embeddings = await this.embedding.embedBatch(changedDocs.map((doc) => doc.content));
+        const items: VectorItem[] = changedDocs.map((doc, idx) => ({
           id: doc.id,
           vector: embeddings[idx],
           metadata: {
@@ -403,10 +470,10 @@ export class WorkspaceSearch {
           },
         }));
         await this.vector.storeBatch(items);
-        summary.vectorIndexed = (summary.vectorIndexed ?? 0) + docs.length;
+        summary.vectorIndexed = (summary.vectorIndexed ?? 0) + changedDocs.length;
       } catch (error: any) {
         summary.errors.push(
-          `Vector indexing failed: ${error?.message ? String(error.message) : "unknown error"}`,
+          `Vector indexing failed: ${describeError(error, "unknown error")}`,
         );
       }
     }
@@ -456,7 +523,10 @@ export class WorkspaceSearch {
     vectorWeight = clampScore(vectorWeight ?? 0);
     const minScore = clampScore(options.minScore ?? 0);
 
-    const filter = (doc: { path: string }) => matchesPathFilter(doc.path, basePath, glob);
+    // Resolve the compiled glob once per query; the matcher cache keeps the
+    // parse cost out of repeated queries entirely
+    const matchGlob = glob ? getGlobMatcher(glob) : undefined;
+    const filter = (doc: { path: string }) => matchesPathFilter(doc.path, basePath, matchGlob);
 
     const bm25Results =
       mode === "bm25" || mode === "hybrid"
@@ -471,8 +541,14 @@ export class WorkspaceSearch {
         ? await this.searchVector(query, topK * 5, filter)
         : [];
 
-    const bm25ScoreMap = new Map(bm25Results.map((item) => [item.id, item.score]));
-    const vectorScoreMap = new Map(vectorResults.map((item) => [item.id, item.score]));
+    const bm25ScoreMap = new Map<string, number>();
+    for (const item of bm25Results) {
+      bm25ScoreMap.set(item.id, item.score);
+    }
+    const vectorScoreMap = new Map<string, number>();
+    for (const item of vectorResults) {
+      vectorScoreMap.set(item.id, item.score);
+    }
     const normalizedBm25 = normalizeScores(bm25Results);
     const normalizedVector = clampScores(vectorResults);
 
@@ -604,12 +680,16 @@ export class WorkspaceSearch {
     const filtered = minScore > 0 ? results.filter((item) => item.score >= minScore) : results;
     const topResults = filtered.slice(0, limit);
 
+    // Tokenize the query once; snippet and line-range extraction for every
+    // result reuse the same terms
+    const queryTerms = tokenizeSearchText(query);
+
     return topResults.map((item) => {
       const doc = this.documents.get(item.id);
       const path = doc?.path ?? item.id;
       const content = doc?.content ?? "";
-      const snippet = content ? buildSnippet(content, query, snippetLength) : undefined;
-      const lineRange = content ? buildLineRange(content, query) : undefined;
+      const snippet = content ? buildSnippet(content, queryTerms, snippetLength) : undefined;
+      const lineRange = content ? buildLineRange(content, queryTerms) : undefined;
       const bm25Normalized = options.bm25Normalized?.get(item.id);
       const vectorNormalized = options.vectorNormalized?.get(item.id);
       const scoreDetails =
@@ -917,7 +997,7 @@ export const createWorkspaceSearchToolkit = (
               total: finalResults.length,
             };
           } catch (error: any) {
-            const message = error?.message ? String(error.message) : "Unknown search error";
+            const message = describeError(error, "Unknown search error");
             return `Search failed: ${message}`;
           }
         },
@@ -565,17 +565,33 @@ export class WorkspaceSkills {
         continue;
       }
 
-      for (const info of infos) {
-        const skillPath = info.path;
-        if (this.maxFileBytes > 0 && info.size && info.size > this.maxFileBytes) {
+      // Read all candidate skill files concurrently; registration stays
+      // sequential below so duplicate-id suffixing remains deterministic
+      const reads = await Promise.all(
+        infos.map(async (info): Promise<{ skillPath: string; content: string } | undefined> => {
+          const skillPath = info.path;
+          if (this.maxFileBytes > 0 && info.size && info.size > this.maxFileBytes) {
+            return undefined;
+          }
+          try {
+            const data = await this.filesystem.readRaw(skillPath, {
+              context: options.context,
+            });
+            return { skillPath, content: data.content.join("\n") };
+          } catch {
+            // ignore invalid skill entries
+            return undefined;
+          }
+        }),
+      );
+
+      for (const read of reads) {
+        if (!read) {
           continue;
         }
+        const { skillPath, content } = read;
 
         try {
-          const data = await this.filesystem.readRaw(skillPath, {
-            context: options.context,
-          });
-          const content = data.content.join("\n");
           const contentBytes = Buffer.byteLength(content, "utf-8");
           if (this.maxFileBytes > 0 && contentBytes > this.maxFileBytes) {
             continue;
@@ -619,9 +635,12 @@ export class WorkspaceSkills {
           this.skillsById.set(id, metadata);
           const normalizedName = name.trim().toLowerCase();
           if (normalizedName) {
-            const existing = this.skillNameMap.get(normalizedName) ?? [];
-            existing.push(id);
-            this.skillNameMap.set(normalizedName, existing);
+            const existing = this.skillNameMap.get(normalizedName);
+            if (existing) {
+              existing.push(id);
+            } else {
+              this.skillNameMap.set(normalizedName, [id]);
+            }
           }
         } catch {
           // ignore invalid skill entries
@@ -740,37 +759,51 @@ export class WorkspaceSkills {
 
     const docs: WorkspaceSkillDocument[] = [];
 
-    for (const metadata of this.skillsById.values()) {
-      try {
-        const skill = await this.loadSkill(metadata.id, { context: options.context });
-        if (!skill) {
-          summary.skipped += 1;
-          continue;
-        }
+    // Load skills concurrently and fold the outcomes in metadata order so the
+    // index contents stay deterministic
+    const loadOutcomes = await Promise.all(
+      Array.from(this.skillsById.values()).map(
+        async (metadata): Promise<{ skill?: WorkspaceSkill | null; error?: string }> => {
+          try {
+            return { skill: await this.loadSkill(metadata.id, { context: options.context }) };
+          } catch (error: any) {
+            return {
+              error: `Failed to load ${metadata.id}: ${error?.message ? String(error.message) : "unknown error"}`,
+            };
+          }
+        },
+      ),
+    );
 
-        const content = [skill.name, skill.description || "", skill.instructions || ""]
-          .join("\n")
-          .trim();
+    for (const outcome of loadOutcomes) {
+      if (outcome.error) {
+        summary.errors.push(outcome.error);
+        continue;
+      }
+      const skill = outcome.skill;
+      if (!skill) {
+        summary.skipped += 1;
+        continue;
+      }
 
-        if (!content) {
-          summary.skipped += 1;
-          continue;
-        }
+      const content = [skill.name, skill.description || "", skill.instructions || ""]
+        .join("\n")
+        .trim();
 
-        docs.push({
-          id: skill.id,
-          name: skill.name,
-          content,
-          metadata: {
-            path: skill.path,
-            tags: skill.tags,
-          },
-        });
-      } catch (error: any) {
-        summary.errors.push(
-          `Failed to load ${metadata.id}: ${error?.message ? String(error.message) : "unknown error"}`,
-        );
+      if (!content) {
+        summary.skipped += 1;
+        continue;
       }
+
+      docs.push({
+        id: skill.id,
+        name: skill.name,
+        content,
+        metadata: {
+          path: skill.path,
+          tags: skill.tags,
+        },
+      });
     }
 
     for (const doc of docs) {
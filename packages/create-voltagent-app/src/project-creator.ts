@@ -33,12 +33,15 @@ export const createProject = async (options: ProjectOptions, targetDir: string):
     let templateCounter = 0;
     const totalTemplates = templates.length;
 
-    for (const template of templates) {
-      templateCounter++;
-      spinner.text = `Processing template ${templateCounter}/${totalTemplates}: ${chalk.dim(template.targetPath)}`;
-
-      await fileManager.processTemplateFile(template, options, targetDir);
-    }
+    // Templates write to disjoint target paths, so process them concurrently
+    // instead of paying one read+write round trip per file.
+    await Promise.all(
+      templates.map(async (template) => {
+        await fileManager.processTemplateFile(template, options, targetDir);
+        templateCounter++;
+        spinner.text = `Processed template ${templateCounter}/${totalTemplates}: ${chalk.dim(template.targetPath)}`;
+      }),
+    );
 
     // Create .gitignore file
     spinner.text = "Setting up git configuration...";
@@ -17,8 +17,11 @@ export const existsInRepo = async ({
   branch?: string;
 }): Promise<boolean> => {
   try {
+    // Only the status code matters, so a HEAD probe skips the directory
+    // listing body the contents API would otherwise serialize and transfer
     const response = await fetch(
       `https://api.github.com/repos/voltagent/voltagent/contents/examples/${encodeURIComponent(path)}?ref=${branch}`,
+      { method: "HEAD" },
     );
     return response.status === 200;
   } catch {
@@ -76,18 +79,15 @@ export const downloadExample = async ({
     return "download-failed";
   }
 
+  // Build the prefix once; the filter runs for every entry in the archive
+  const examplePathPrefix = `voltagent-${branch}/examples/${example}/`;
+
   try {
     await tar.x({
       file: tempFile,
       cwd: targetDir,
       strip: stripComponents,
-      filter: (p: string) => {
-        const relativePath = `voltagent-${branch}/examples/${example}/`;
-        if (p.includes(relativePath)) {
-          return true;
-        }
-        return false;
-      },
+      filter: (p: string) => p.includes(examplePathPrefix),
     });
   } catch {
     try {
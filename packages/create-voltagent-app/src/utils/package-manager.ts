@@ -9,19 +9,32 @@ interface PackageManagerInfo {
   isInstalled: boolean;
 }
 
+// Availability of a package manager doesn't change during a single run,
+// so probe each command at most once instead of spawning `which` repeatedly
+const commandExistsCache = new Map<string, boolean>();
+
 /**
  * Check if a command exists on the system
  * Works cross-platform (Windows and Unix)
  */
 const commandExists = (command: string): boolean => {
+  const cached = commandExistsCache.get(command);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  let exists: boolean;
   try {
     // Use 'where' on Windows, 'which' on Unix-like systems
     const checkCommand = process.platform === "win32" ? "where" : "which";
     execSync(`${checkCommand} ${command}`, { stdio: "ignore" });
-    return true;
+    exists = true;
   } catch {
-    return false;
+    exists = false;
   }
+
+  commandExistsCache.set(command, exists);
+  return exists;
 };
 
 /**
@@ -30,6 +30,78 @@ function getDirname(): string {
 const __dirname = getDirname();
 const packageRoot = path.resolve(__dirname, "..");
 
+// Upper bound for files considered by full-text search (1 MiB)
+const MAX_SEARCH_FILE_BYTES = 1024 * 1024;
+
+// Documentation extensions recognized by the search and structure walks;
+// one set lookup per entry instead of a suffix check per extension
+const DOC_FILE_EXTENSIONS = new Set([".md", ".mdx"]);
+
+const isDocumentationFile = (fileName: string): boolean =>
+  DOC_FILE_EXTENSIONS.has(path.extname(fileName).toLowerCase());
+
+// Titles sit in the first heading, so structure listings only need the head of
+// each document instead of buffering whole files
+const TITLE_HEAD_BYTES = 4096;
+
+function readFileHead(fullPath: string): { head: string; size: number } {
+  const stat = fs.statSync(fullPath);
+  const fd = fs.openSync(fullPath, "r");
+  try {
+    const buffer = Buffer.alloc(Math.min(stat.size, TITLE_HEAD_BYTES));
+    const bytesRead = fs.readSync(fd, buffer, 0, buffer.length, 0);
+    return { head: buffer.toString("utf-8", 0, bytesRead), size: stat.size };
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+// Dependency names that mark an example as using a relevant technology.
+// One compiled alternation replaces a chain of substring scans per dependency.
+const EXAMPLE_TECH_PATTERN = /voltagent|ai|anthropic|openai|vercel|next|react|supabase|postgres/;
+
+// Docs rarely change while the server runs, so cache file contents across
+// queries and invalidate by mtime/size. The cache is bounded: entries are
+// re-inserted on hit so Map iteration order doubles as LRU order, and the
+// least recently used entry is evicted once the cap is reached.
+const MAX_SEARCH_CACHE_ENTRIES = 512;
+
+const searchContentCache = new Map<
+  string,
+  { mtimeMs: number; size: number; content: string; lowercaseContent: string }
+>();
+
+function readSearchableFile(
+  fullPath: string,
+): { content: string; lowercaseContent: string } | null {
+  const stat = fs.statSync(fullPath);
+  if (stat.size > MAX_SEARCH_FILE_BYTES) {
+    return null;
+  }
+  const cached = searchContentCache.get(fullPath);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    searchContentCache.delete(fullPath);
+    searchContentCache.set(fullPath, cached);
+    return cached;
+  }
+  const content = fs.readFileSync(fullPath, "utf-8");
+  const entry = {
+    mtimeMs: stat.mtimeMs,
+    size: stat.size,
+    content,
+    lowercaseContent: content.toLowerCase(),
+  };
+  searchContentCache.delete(fullPath);
+  if (searchContentCache.size >= MAX_SEARCH_CACHE_ENTRIES) {
+    const oldestKey = searchContentCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      searchContentCache.delete(oldestKey);
+    }
+  }
+  searchContentCache.set(fullPath, entry);
+  return entry;
+}
+
 // Types for search results
 export type DocumentationSearchResult = {
   filepath: string;
@@ -408,6 +480,8 @@ async function searchDocumentation(
     return results;
   }
 
+  const lowercaseQuery = query.toLowerCase();
+
   const searchInDirectory = (dirPath: string, currentSection = "") => {
     const items = fs.readdirSync(dirPath, { withFileTypes: true });
 
@@ -417,28 +491,33 @@ async function searchDocumentation(
       if (item.isDirectory()) {
         const sectionName = currentSection ? `${currentSection}/${item.name}` : item.name;
         searchInDirectory(fullPath, sectionName);
-      } else if (item.name.endsWith(".md") || item.name.endsWith(".mdx")) {
+      } else if (isDocumentationFile(item.name)) {
         try {
-          const content = fs.readFileSync(fullPath, "utf-8");
-          const lowercaseContent = content.toLowerCase();
-          const lowercaseQuery = query.toLowerCase();
+          const cachedFile = readSearchableFile(fullPath);
+          if (!cachedFile) {
+            continue;
+          }
+          const { content, lowercaseContent } = cachedFile;
 
-          if (lowercaseContent.includes(lowercaseQuery)) {
-            const lines = content.split("\n");
-            const titleLine = lines.find((line) => line.startsWith("# ")) || lines[0];
-            const title = titleLine?.replace(/^#\s*/, "") || item.name;
+          // Single indexOf scan doubles as the match test and context anchor.
+          const matchIndex = lowercaseContent.indexOf(lowercaseQuery);
+          if (matchIndex !== -1) {
+            const titleMatch = /^# (.+)$/m.exec(content);
+            const title = titleMatch?.[1] || content.split("\n", 1)[0] || item.name;
 
             // Find context around the match
-            const matchIndex = lowercaseContent.indexOf(lowercaseQuery);
             const start = Math.max(0, matchIndex - 150);
             const end = Math.min(content.length, matchIndex + 150);
             const excerpt = content.slice(start, end).trim();
 
+            // Resolve the relative path once; it feeds both the result path
+            // and the section fallback
+            const relativePath = path.relative(docsPath, fullPath);
             results.push({
-              filepath: path.relative(docsPath, fullPath),
+              filepath: relativePath,
               title,
               excerpt: `...${excerpt}...`,
-              section: currentSection || path.dirname(path.relative(docsPath, fullPath)),
+              section: currentSection || path.dirname(relativePath),
             });
           }
         } catch (error) {
@@ -470,17 +549,16 @@ async function getDocumentationStructure(
       if (item.isDirectory()) {
         obj[item.name] = {};
         buildStructure(fullPath, obj[item.name]);
-      } else if (item.name.endsWith(".md") || item.name.endsWith(".mdx")) {
+      } else if (isDocumentationFile(item.name)) {
         try {
-          const content = fs.readFileSync(fullPath, "utf-8");
-          const lines = content.split("\n");
-          const titleLine = lines.find((line) => line.startsWith("# ")) || lines[0];
+          const { head, size } = readFileHead(fullPath);
+          const titleLine = /^# .+$/m.exec(head)?.[0] ?? head.split("\n", 1)[0];
           const title = titleLine?.replace(/^#\s*/, "") || item.name;
 
           obj[item.name] = {
             title,
             path: path.relative(docsPath, fullPath),
-            size: fs.statSync(fullPath).size,
+            size,
           };
         } catch {
           obj[item.name] = {
@@ -513,6 +591,7 @@ async function searchExamples(
 
   const items = fs.readdirSync(examplesPath, { withFileTypes: true });
   const lowercaseQuery = query.toLowerCase();
+  const lowercaseTechnology = technology?.toLowerCase();
 
   for (const item of items) {
     if (item.isDirectory()) {
@@ -532,18 +611,7 @@ async function searchExamples(
 
           // Extract technologies from dependencies
           const deps = { ...packageJson.dependencies, ...packageJson.devDependencies };
-          technologies = Object.keys(deps).filter(
-            (dep) =>
-              dep.includes("voltagent") ||
-              dep.includes("ai") ||
-              dep.includes("anthropic") ||
-              dep.includes("openai") ||
-              dep.includes("vercel") ||
-              dep.includes("next") ||
-              dep.includes("react") ||
-              dep.includes("supabase") ||
-              dep.includes("postgres"),
-          );
+          technologies = Object.keys(deps).filter((dep) => EXAMPLE_TECH_PATTERN.test(dep));
         }
 
         // Extract description from README if not found in package.json
@@ -553,16 +621,20 @@ async function searchExamples(
           description = descriptionMatch?.[1] || "";
         }
 
-        // Check if this example matches the search criteria
+        // Check if this example matches the search criteria. Lowercase the
+        // name and technology list once per example; both filters reuse them.
+        const lowercaseName = item.name.toLowerCase();
+        const lowercaseTechnologies = technologies.map((tech) => tech.toLowerCase());
+
         const matchesQuery =
-          item.name.toLowerCase().includes(lowercaseQuery) ||
+          lowercaseName.includes(lowercaseQuery) ||
           description.toLowerCase().includes(lowercaseQuery) ||
-          technologies.some((tech) => tech.toLowerCase().includes(lowercaseQuery));
+          lowercaseTechnologies.some((tech) => tech.includes(lowercaseQuery));
 
         const matchesTechnology =
-          !technology ||
-          item.name.toLowerCase().includes(technology.toLowerCase()) ||
-          technologies.some((tech) => tech.toLowerCase().includes(technology.toLowerCase()));
+          !lowercaseTechnology ||
+          lowercaseName.includes(lowercaseTechnology) ||
+          lowercaseTechnologies.some((tech) => tech.includes(lowercaseTechnology));
 
         if (matchesQuery && matchesTechnology) {
           results.push({
@@ -638,48 +710,62 @@ async function discoverExampleFiles(examplePath: string): Promise<string[]> {
     "index.js",
   ];
 
-  for (const file of keyFiles) {
-    if (await fileExists(path.join(examplePath, file))) {
+  // Probe all candidates concurrently; awaiting each stat serially makes the
+  // discovery latency the sum of six round trips instead of the slowest one
+  const keyFileChecks = await Promise.all(
+    keyFiles.map(async (file) => ({
+      file,
+      exists: await fileExists(path.join(examplePath, file)),
+    })),
+  );
+  for (const { file, exists } of keyFileChecks) {
+    if (exists) {
       files.add(file);
     }
   }
 
-  // Helper function to recursively find .ts files in a directory with depth limit
-  const findTsFiles = async (
-    dirPath: string,
-    relativePath = "",
-    currentDepth = 0,
-  ): Promise<void> => {
-    if (currentDepth >= 4 || !(await fileExists(dirPath))) return;
+  // Cap matches at the same depth the previous manual walk enforced
+  // (directories nested at most three levels under the search root)
+  const MAX_TS_FILE_PATH_SEGMENTS = 4;
+
+  // Helper function to find .ts files via Node's native recursive listing,
+  // which traverses the tree in one call instead of a readdir per directory
+  const findTsFiles = async (dirPath: string, relativePath: string): Promise<void> => {
+    if (!(await fileExists(dirPath))) return;
 
     try {
-      const items = await fs.promises.readdir(dirPath, { withFileTypes: true });
+      const items = await fs.promises.readdir(dirPath, {
+        withFileTypes: true,
+        recursive: true,
+      });
 
       for (const item of items) {
-        const itemPath = path.join(dirPath, item.name);
-        const relativeItemPath = relativePath ? path.join(relativePath, item.name) : item.name;
-
-        if (item.isDirectory()) {
-          // Recursively search subdirectories with depth tracking (sequential)
-          await findTsFiles(itemPath, relativeItemPath, currentDepth + 1);
-        } else if (item.isFile() && item.name.endsWith(".ts")) {
-          // Only include .ts files, Set handles deduplication automatically
-          files.add(relativeItemPath.replace(/\\/g, "/"));
+        if (!item.isFile() || !item.name.endsWith(".ts")) {
+          continue;
         }
+
+        // Dirent.parentPath landed in Node 20.12; older runtimes expose the
+        // same value under the deprecated `path` property
+        const parentPath = item.parentPath ?? (item as any).path;
+        const relativeToRoot = path.relative(dirPath, path.join(parentPath, item.name));
+        if (relativeToRoot.split(path.sep).length > MAX_TS_FILE_PATH_SEGMENTS) {
+          continue;
+        }
+
+        // Only include .ts files, Set handles deduplication automatically
+        files.add(path.join(relativePath, relativeToRoot).replace(/\\/g, "/"));
       }
     } catch (error) {
       console.warn(`Error reading directory ${dirPath}:`, error);
     }
   };
 
-  // Apply glob patterns sequentially: src/*.ts and src/**/*.ts
-  await findTsFiles(path.join(examplePath, "src"), "src");
-
-  // Apply glob pattern: app/**/*.ts
-  await findTsFiles(path.join(examplePath, "app"), "app");
-
-  // Apply glob pattern: voltagent/*.ts
-  await findTsFiles(path.join(examplePath, "voltagent"), "voltagent");
+  // The three search roots are independent, so walk them concurrently
+  await Promise.all([
+    findTsFiles(path.join(examplePath, "src"), "src"),
+    findTsFiles(path.join(examplePath, "app"), "app"),
+    findTsFiles(path.join(examplePath, "voltagent"), "voltagent"),
+  ]);
 
   return [...files];
 }
@@ -703,6 +789,8 @@ async function listExamples(examplesPath: string, category?: string): Promise<Ex
   }
 
   const items = fs.readdirSync(examplesPath, { withFileTypes: true });
+  // Lowercase the requested category once; the filter below runs per example
+  const lowercaseCategory = category?.toLowerCase();
 
   for (const item of items) {
     if (item.isDirectory()) {
@@ -744,9 +832,9 @@ async function listExamples(examplesPath: string, category?: string): Promise<Ex
 
         // Filter by category if specified
         if (
-          !category ||
-          exampleCategory.includes(category.toLowerCase()) ||
-          item.name.toLowerCase().includes(category.toLowerCase())
+          !lowercaseCategory ||
+          exampleCategory.includes(lowercaseCategory) ||
+          item.name.toLowerCase().includes(lowercaseCategory)
         ) {
           examples.push({
             name: item.name,
@@ -820,8 +908,10 @@ function parseChangelogEntries(
 ): Array<{ version: string; date?: string; changes: string[]; content: string }> {
   const entries: Array<{ version: string; date?: string; changes: string[]; content: string }> = [];
   const lines = content.split("\n");
-  let currentEntry: { version: string; date?: string; changes: string[]; content: string } | null =
-    null;
+  let currentEntry: { version: string; date?: string; changes: string[] } | null = null;
+  // Collect entry lines and join once per entry; appending to a string per
+  // line re-copies the accumulated entry and goes quadratic on long changelogs
+  let currentLines: string[] = [];
   let currentSection = "";
 
   for (const line of lines) {
@@ -835,7 +925,7 @@ function parseChangelogEntries(
       if (currentEntry) {
         entries.push({
           ...currentEntry,
-          content: currentEntry.content.trim(),
+          content: currentLines.join("\n").trim(),
         });
 
         if (entries.length >= maxEntries) {
@@ -848,11 +938,11 @@ function parseChangelogEntries(
         version: versionMatch[1],
         date: versionMatch[2],
         changes: [],
-        content: `${line}\n`,
       };
+      currentLines = [line];
       currentSection = "";
     } else if (currentEntry) {
-      currentEntry.content += `${line}\n`;
+      currentLines.push(line);
 
       // Track section headers like ### Added, ### Fixed, etc.
       const sectionMatch = line.match(/^###\s*(.+)/);
@@ -874,7 +964,7 @@ function parseChangelogEntries(
   if (currentEntry && entries.length < maxEntries) {
     entries.push({
       ...currentEntry,
-      content: currentEntry.content.trim(),
+      content: currentLines.join("\n").trim(),
     });
   }
 
@@ -927,22 +1017,18 @@ async function searchInChangelogs(
           for (const entry of entries) {
             const entryContent = entry.content.toLowerCase();
 
-            if (entryContent.includes(lowercaseQuery)) {
-              // Find the specific match context
-              const lines = entry.content.split("\n");
-              let matchedContent = "";
-              let context = "";
-
-              for (const line of lines) {
-                if (line.toLowerCase().includes(lowercaseQuery)) {
-                  matchedContent = line.trim();
-                  break;
-                }
-              }
+            // One lowercase pass: the match index locates the matched line
+            // directly instead of re-lowercasing every line
+            const matchIndex = entryContent.indexOf(lowercaseQuery);
+            if (matchIndex !== -1) {
+              const lineStart = entryContent.lastIndexOf("\n", matchIndex) + 1;
+              const lineEnd = entryContent.indexOf("\n", matchIndex);
+              const matchedContent = entry.content
+                .slice(lineStart, lineEnd === -1 ? entry.content.length : lineEnd)
+                .trim();
 
               // Get some context around the match
-              const contextLines = lines.slice(0, Math.min(lines.length, 5));
-              context = contextLines.join("\n").trim();
+              const context = entry.content.split("\n", 5).join("\n").trim();
 
               results.push({
                 packageName: item.name,
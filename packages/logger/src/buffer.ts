@@ -1,10 +1,25 @@
 import type { LogBuffer, LogEntry, LogFilter } from "./types";
 
+// Built once at module load; the lookup runs for every buffered entry when a
+// level filter is active
+const LEVEL_PRIORITIES: Record<string, number> = {
+  trace: 10,
+  debug: 20,
+  info: 30,
+  warn: 40,
+  error: 50,
+  fatal: 60,
+};
+
 /**
  * In-memory circular buffer for storing recent log entries
  */
 export class InMemoryLogBuffer implements LogBuffer {
   private buffer: LogEntry[] = [];
+  // Index of the oldest retained entry. Overflow advances this cursor instead
+  // of shifting the whole array per added log, and the dropped prefix is
+  // compacted away in one slice once it grows as large as the live window.
+  private head = 0;
   private maxSize: number;
 
   constructor(maxSize = 1000) {
@@ -15,57 +30,50 @@ export class InMemoryLogBuffer implements LogBuffer {
     this.buffer.push(entry);
 
     // Remove oldest entries if buffer exceeds max size
-    if (this.buffer.length > this.maxSize) {
-      this.buffer.shift();
+    if (this.buffer.length - this.head > this.maxSize) {
+      this.head += 1;
+      if (this.head >= this.maxSize) {
+        this.buffer = this.buffer.slice(this.head);
+        this.head = 0;
+      }
     }
   }
 
   query(filter?: LogFilter): LogEntry[] {
     if (!filter) {
-      return [...this.buffer];
-    }
-
-    let results = this.buffer;
-
-    // Filter by level
-    if (filter.level) {
-      const levelPriority = this.getLevelPriority(filter.level);
-      results = results.filter((entry) => this.getLevelPriority(entry.level) >= levelPriority);
+      return this.buffer.slice(this.head);
     }
 
-    // Filter by agentId
-    if (filter.agentId) {
-      results = results.filter((entry) => entry.agentId === filter.agentId);
-    }
-
-    // Filter by conversationId
-    if (filter.conversationId) {
-      results = results.filter((entry) => entry.conversationId === filter.conversationId);
-    }
-
-    // Filter by workflowId
-    if (filter.workflowId) {
-      results = results.filter((entry) => entry.workflowId === filter.workflowId);
-    }
-
-    // Filter by executionId (also check parentExecutionId for sub-agent logs)
-    if (filter.executionId) {
-      results = results.filter(
-        (entry) =>
-          entry.executionId === filter.executionId ||
-          entry.parentExecutionId === filter.executionId,
-      );
-    }
-
-    // Filter by time range
-    if (filter.since || filter.until) {
-      results = results.filter((entry) => {
-        const entryTime = new Date(entry.timestamp);
-        // Return logs that are after 'since' and before or equal to 'until'
-        if (filter.since && entryTime < filter.since) return false;
-        if (filter.until && entryTime > filter.until) return false;
-        return true;
-      });
+    // Evaluate every active clause in one pass instead of rebuilding the
+    // result array per clause; thresholds are resolved up front
+    const minPriority = filter.level ? this.getLevelPriority(filter.level) : undefined;
+    const sinceTime = filter.since ? filter.since.getTime() : undefined;
+    const untilTime = filter.until ? filter.until.getTime() : undefined;
+
+    let results: LogEntry[] = [];
+    for (let idx = this.head; idx < this.buffer.length; idx += 1) {
+      const entry = this.buffer[idx];
+      if (minPriority !== undefined && this.getLevelPriority(entry.level) < minPriority) {
+        continue;
+      }
+      if (filter.agentId && entry.agentId !== filter.agentId) continue;
+      if (filter.conversationId && entry.conversationId !== filter.conversationId) continue;
+      if (filter.workflowId && entry.workflowId !== filter.workflowId) continue;
+      // Also check parentExecutionId for sub-agent logs
+      if (
+        filter.executionId &&
+        entry.executionId !== filter.executionId &&
+        entry.parentExecutionId !== filter.executionId
+      ) {
+        continue;
+      }
+      // Return logs that are after 'since' and before or equal to 'until'
+      if (sinceTime !== undefined || untilTime !== undefined) {
+        const entryTime = new Date(entry.timestamp).getTime();
+        if (sinceTime !== undefined && entryTime < sinceTime) continue;
+        if (untilTime !== undefined && entryTime > untilTime) continue;
+      }
+      results.push(entry);
     }
 
     // Apply limit
@@ -73,27 +81,21 @@ export class InMemoryLogBuffer implements LogBuffer {
       results = results.slice(-filter.limit);
     }
 
-    return [...results];
+    return results;
   }
 
   clear(): void {
     this.buffer = [];
+    this.head = 0;
   }
 
   size(): number {
-    return this.buffer.length;
+    return this.buffer.length - this.head;
   }
 
   private getLevelPriority(level: string): number {
-    const priorities: Record<string, number> = {
-      trace: 10,
-      debug: 20,
-      info: 30,
-      warn: 40,
-      error: 50,
-      fatal: 60,
-    };
-
-    return priorities[level.toLowerCase()] || 0;
+    // Levels are stored lowercase already; only allocate a lowercased copy
+    // for the rare caller that passes mixed case
+    return LEVEL_PRIORITIES[level] ?? LEVEL_PRIORITIES[level.toLowerCase()] ?? 0;
   }
 }
@@ -4,6 +4,7 @@
  * Compatible with existing PostgreSQL storage structure
  */
 
+import { randomUUID } from "node:crypto";
 import type { ConnectionOptions } from "node:tls";
 import { ConversationAlreadyExistsError, ConversationNotFoundError } from "@voltagent/core";
 import type {
@@ -111,9 +112,8 @@ export class PostgreSQLMemoryAdapter implements StorageAdapter {
    * Generate a random ID
    */
   private generateId(): string {
-    return (
-      Math.random().toString(36).substring(2, 15) + Math.random().toString(36).substring(2, 15)
-    );
+    // Math.random ids are neither unique nor unpredictable; use the CSPRNG
+    return randomUUID();
   }
 
   /**
@@ -236,45 +236,34 @@ export class PostgreSQLMemoryAdapter implements StorageAdapter {
         )
       `);
 
-      // Create indexes for better performance
+      // Create indexes for better performance.
+      // One multi-statement query keeps this to a single round-trip instead of
+      // eight; these statements take no parameters, so the simple query
+      // protocol handles them in one batch.
       await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseConversationsTable}_user_id 
-        ON ${conversationsTable}(user_id)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseConversationsTable}_user_id
+        ON ${conversationsTable}(user_id);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseConversationsTable}_resource_id 
-        ON ${conversationsTable}(resource_id)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseConversationsTable}_resource_id
+        ON ${conversationsTable}(resource_id);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseMessagesTable}_conversation_id 
-        ON ${messagesTable}(conversation_id)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseMessagesTable}_conversation_id
+        ON ${messagesTable}(conversation_id);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseMessagesTable}_created_at 
-        ON ${messagesTable}(created_at)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseMessagesTable}_created_at
+        ON ${messagesTable}(created_at);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseWorkflowStatesTable}_workflow_id 
-        ON ${workflowStatesTable}(workflow_id)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseWorkflowStatesTable}_workflow_id
+        ON ${workflowStatesTable}(workflow_id);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseWorkflowStatesTable}_status 
-        ON ${workflowStatesTable}(status)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseWorkflowStatesTable}_status
+        ON ${workflowStatesTable}(status);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseStepsTable}_conversation 
-        ON ${stepsTable}(conversation_id, step_index)
-      `);
+        CREATE INDEX IF NOT EXISTS idx_${baseStepsTable}_conversation
+        ON ${stepsTable}(conversation_id, step_index);
 
-      await client.query(`
-        CREATE INDEX IF NOT EXISTS idx_${baseStepsTable}_operation 
-        ON ${stepsTable}(conversation_id, operation_id)
+        CREATE INDEX IF NOT EXISTS idx_${baseStepsTable}_operation
+        ON ${stepsTable}(conversation_id, operation_id);
       `);
 
       // Run migration for existing tables
@@ -9,50 +9,51 @@ export type HtmlChunkerOptions = {
   label?: string;
 } & ChunkMetadataInput;
 
-function normalizeHtml(html: string): string {
-  // Replace block-level tags with newlines to preserve rough structure
-  const blockTags = [
-    "p",
-    "div",
-    "section",
-    "article",
-    "header",
-    "footer",
-    "main",
-    "nav",
-    "ul",
-    "ol",
-    "li",
-    "table",
-    "tr",
-    "td",
-    "th",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "br",
-  ];
-  const blockRegex = new RegExp(`</?(${blockTags.join("|")})[^>]*>`, "gi");
-  const entityMap: Record<string, string> = {
-    "&nbsp;": " ",
-    "&amp;": "&",
-    "&lt;": "<",
-    "&gt;": ">",
-    "&quot;": '"',
-    "&#39;": "'",
-  };
+// Block-level tags are replaced with newlines to preserve rough structure.
+// Compiled once at module scope; normalizeHtml runs per document.
+const BLOCK_TAGS = [
+  "p",
+  "div",
+  "section",
+  "article",
+  "header",
+  "footer",
+  "main",
+  "nav",
+  "ul",
+  "ol",
+  "li",
+  "table",
+  "tr",
+  "td",
+  "th",
+  "h1",
+  "h2",
+  "h3",
+  "h4",
+  "h5",
+  "h6",
+  "br",
+];
+const BLOCK_TAG_REGEX = new RegExp(`</?(${BLOCK_TAGS.join("|")})[^>]*>`, "gi");
+// One alternation pass decodes every named entity instead of one scan each
+const ENTITY_PATTERN = /&(?:nbsp|amp|lt|gt|quot|#39);/g;
+const ENTITY_MAP: Record<string, string> = {
+  "&nbsp;": " ",
+  "&amp;": "&",
+  "&lt;": "<",
+  "&gt;": ">",
+  "&quot;": '"',
+  "&#39;": "'",
+};
 
+function normalizeHtml(html: string): string {
   let text = html.replace(/<(script|style)[^>]*>[\s\S]*?<\/\1>/gi, "");
-  text = text.replace(blockRegex, "\n");
+  text = text.replace(BLOCK_TAG_REGEX, "\n");
   text = text.replace(/<br\s*\/?>/gi, "\n");
   text = text.replace(/<[^>]+>/g, "");
   // Decode common named entities
-  Object.entries(entityMap).forEach(([k, v]) => {
-    text = text.replace(new RegExp(k, "g"), v);
-  });
+  text = text.replace(ENTITY_PATTERN, (entity) => ENTITY_MAP[entity]);
   // Decode numeric entities
   text = text.replace(/&#(\d+);/g, (_, code) => String.fromCharCode(Number(code)));
   text = text.replace(/&#x([0-9a-fA-F]+);/g, (_, code) =>
@@ -14,8 +14,11 @@ function isTableLine(line: string): boolean {
   const trimmed = line.trim();
   if (!trimmed) return false;
   if (trimmed.startsWith("|") && trimmed.includes("|")) return true;
-  const commaCount = trimmed.split(",").length - 1;
-  return commaCount >= 2 && !/[.;]$/.test(trimmed);
+  // Need at least two commas; indexOf avoids splitting every line into an array
+  const firstComma = trimmed.indexOf(",");
+  if (firstComma === -1) return false;
+  const secondComma = trimmed.indexOf(",", firstComma + 1);
+  return secondComma !== -1 && !/[.;]$/.test(trimmed);
 }
 
 export class TableChunker implements Chunker<TableChunkerOptions> {
@@ -26,13 +26,16 @@ export function extractSummary(nodes: DocNode[]): DocNode[] {
 }
 
 export function extractKeywords(nodes: DocNode[], topN = 5): DocNode[] {
-  const freq: Record<string, number> = {};
-  const words = nodes.flatMap((n) => n.text.toLowerCase().match(/\b[a-z]{3,}\b/g) || []);
-  words.forEach((w) => {
-    freq[w] = (freq[w] ?? 0) + 1;
-  });
-  const keywords = Object.entries(freq)
-    .sort((a, b) => (b[1] ?? 0) - (a[1] ?? 0))
+  // Count matches as they stream out of the regex instead of materializing
+  // every word of every node into one flattened array first
+  const freq = new Map<string, number>();
+  for (const node of nodes) {
+    for (const match of node.text.toLowerCase().matchAll(/\b[a-z]{3,}\b/g)) {
+      freq.set(match[0], (freq.get(match[0]) ?? 0) + 1);
+    }
+  }
+  const keywords = Array.from(freq.entries())
+    .sort((a, b) => b[1] - a[1])
     .slice(0, topN)
     .map(([w]) => w);
   return nodes.map((node) => ({
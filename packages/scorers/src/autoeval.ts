@@ -246,11 +246,25 @@ function normalizeScoreText(value: unknown): string {
   }
 }
 
+// Cheapest faithful copy first: native structuredClone, then the JSON round
+// trip, then a shallow spread
+const structuredCloneImpl = (globalThis as any).structuredClone as
+  | (<TValue>(input: TValue) => TValue)
+  | undefined;
+
 function cloneRecord(value: unknown): Record<string, unknown> | undefined {
   if (!value || typeof value !== "object") {
     return undefined;
   }
 
+  if (typeof structuredCloneImpl === "function") {
+    try {
+      return structuredCloneImpl(value) as Record<string, unknown>;
+    } catch {
+      // Fall through to the JSON round trip for non-cloneable values
+    }
+  }
+
   try {
     return JSON.parse(safeStringify(value)) as Record<string, unknown>;
   } catch {
@@ -84,17 +84,50 @@ interface EvaluateChoiceArgs {
   judgeInstructions?: string;
 }
 
+// Judge agents are stateless, so reuse one per model/instructions pair instead
+// of constructing a fresh Agent for every evaluated item. Object model
+// references are keyed by identity; string router ids go through a plain map.
+const judgeAgentsByModel = new WeakMap<object, Map<string, Agent>>();
+const judgeAgentsByModelId = new Map<string, Agent>();
+
+function getJudgeAgent(scorerId: string, model: AgentModelReference, instructions: string): Agent {
+  const key = `${scorerId}\u0000${instructions}`;
+
+  if (typeof model === "string") {
+    const cacheKey = `${model}\u0000${key}`;
+    let agent = judgeAgentsByModelId.get(cacheKey);
+    if (!agent) {
+      agent = new Agent({ name: `${scorerId}-judge`, model, instructions });
+      judgeAgentsByModelId.set(cacheKey, agent);
+    }
+    return agent;
+  }
+
+  let byKey = judgeAgentsByModel.get(model);
+  if (!byKey) {
+    byKey = new Map();
+    judgeAgentsByModel.set(model, byKey);
+  }
+
+  let agent = byKey.get(key);
+  if (!agent) {
+    agent = new Agent({ name: `${scorerId}-judge`, model, instructions });
+    byKey.set(key, agent);
+  }
+  return agent;
+}
+
 async function evaluateChoice(args: EvaluateChoiceArgs): Promise<ChoiceAnalysis> {
   const { context, model, buildPrompt, choices, maxOutputTokens, scorerId, judgeInstructions } =
     args;
 
   const prompt = await buildPrompt(context);
 
-  const agent = new Agent({
-    name: `${scorerId}-judge`,
+  const agent = getJudgeAgent(
+    scorerId,
     model,
-    instructions: judgeInstructions ?? buildDefaultChoiceInstructions(Object.keys(choices)),
-  });
+    judgeInstructions ?? buildDefaultChoiceInstructions(Object.keys(choices)),
+  );
 
   const response = await agent.generateObject(prompt, CHOICE_RESPONSE_SCHEMA, {
     maxOutputTokens,
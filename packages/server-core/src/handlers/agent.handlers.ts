@@ -2,11 +2,8 @@ import { ClientHTTPError, type ServerProviderDeps } from "@voltagent/core";
 import { convertUsage } from "@voltagent/core";
 import { type Logger, safeStringify } from "@voltagent/internal";
 import { type UIMessage, UI_MESSAGE_STREAM_HEADERS, generateId } from "ai";
-import { z } from "zod";
-import { convertJsonSchemaToZod } from "zod-from-json-schema";
-import { convertJsonSchemaToZod as convertJsonSchemaToZodV3 } from "zod-from-json-schema-v3";
 import type { ApiResponse } from "../types";
-import { processAgentOptions } from "../utils/options";
+import { jsonSchemaToZod, processAgentOptions } from "../utils/options";
 
 /**
  * Handler for listing all agents
@@ -480,9 +477,7 @@ export async function handleGenerateObject(
     const options = processAgentOptions(body, signal);
 
     // Convert JSON schema to Zod schema (supports zod v3 and v4)
-    const zodSchema = ("toJSONSchema" in z ? convertJsonSchemaToZod : convertJsonSchemaToZodV3)(
-      jsonSchema,
-    ) as any;
+    const zodSchema = jsonSchemaToZod(jsonSchema);
 
     const result = await agent.generateObject(input, zodSchema, options);
 
@@ -531,9 +526,7 @@ export async function handleStreamObject(
     const options = processAgentOptions(body, signal);
 
     // Convert JSON schema to Zod schema (supports zod v3 and v4)
-    const zodSchema = ("toJSONSchema" in z ? convertJsonSchemaToZod : convertJsonSchemaToZodV3)(
-      jsonSchema,
-    ) as any;
+    const zodSchema = jsonSchemaToZod(jsonSchema);
 
     const result = await agent.streamObject(input, zodSchema, options);
 
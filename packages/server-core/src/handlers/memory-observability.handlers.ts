@@ -44,27 +44,30 @@ function getAgentsWithMemory(
 ): AgentMemoryContext[] {
   const agents = deps.agentRegistry.getAllAgents();
 
-  return agents
-    .filter((agent) => {
-      if (targetAgentId && agent.getFullState().id !== targetAgentId) {
-        return false;
-      }
-      const memory = agent.getMemory();
-      return (
-        typeof memory === "object" &&
-        memory !== null &&
-        typeof (memory as Memory).queryConversations === "function"
-      );
-    })
-    .map((agent) => {
-      const state = agent.getFullState();
-      return {
-        agent,
-        agentId: state.id,
-        agentName: state.name,
-        memory: agent.getMemory() as Memory,
-      };
+  // Build the full state snapshot and resolve memory once per agent; the
+  // previous filter/map pair rebuilt both for every agent that passed
+  const contexts: AgentMemoryContext[] = [];
+  for (const agent of agents) {
+    const state = agent.getFullState();
+    if (targetAgentId && state.id !== targetAgentId) {
+      continue;
+    }
+    const memory = agent.getMemory();
+    if (
+      typeof memory !== "object" ||
+      memory === null ||
+      typeof (memory as Memory).queryConversations !== "function"
+    ) {
+      continue;
+    }
+    contexts.push({
+      agent,
+      agentId: state.id,
+      agentName: state.name,
+      memory: memory as Memory,
     });
+  }
+  return contexts;
 }
 
 function sortConversations(
@@ -71,7 +71,16 @@ export async function setupObservabilityHandler(
         }
       }
 
-      await fs.writeFile(envPath, envContent);
+      // Write to a temp file and rename so a crash mid-write cannot leave a
+      // truncated .env behind
+      const tempPath = `${envPath}.${process.pid}.tmp`;
+      try {
+        await fs.writeFile(tempPath, envContent);
+        await fs.rename(tempPath, envPath);
+      } catch (writeError) {
+        await fs.rm(tempPath, { force: true });
+        throw writeError;
+      }
 
       logger.info(
         "Observability configuration updated in .env file. Please restart your application.",
@@ -208,11 +208,9 @@ export async function getObservabilityStatusHandler(deps: ServerProviderDeps): P
       const traceIds = await storage.listTraces();
       traceCount = traceIds.length;
 
-      // Count all spans across traces
-      for (const traceId of traceIds) {
-        const spans = await storage.getTrace(traceId);
-        spanCount += spans.length;
-      }
+      // Count all spans across traces; the per-trace reads are independent
+      const traceSpans = await Promise.all(traceIds.map((traceId) => storage.getTrace(traceId)));
+      spanCount = traceSpans.reduce((sum, spans) => sum + spans.length, 0);
 
       // Get log count if available
       if (storage.queryLogs) {
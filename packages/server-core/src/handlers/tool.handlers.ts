@@ -67,10 +67,18 @@ const extractToolTags = (tool: unknown): string[] | undefined => {
     return undefined;
   }
 
-  const normalized = candidate.tags
-    .filter((tag): tag is string => typeof tag === "string")
-    .map((tag) => tag.trim())
-    .filter((tag) => tag.length > 0);
+  // One pass instead of filter/map/filter, which allocated an intermediate
+  // array per stage for every tool on every listing request
+  const normalized: string[] = [];
+  for (const tag of candidate.tags) {
+    if (typeof tag !== "string") {
+      continue;
+    }
+    const trimmed = tag.trim();
+    if (trimmed.length > 0) {
+      normalized.push(trimmed);
+    }
+  }
 
   return normalized.length > 0 ? normalized : undefined;
 };
@@ -12,7 +12,9 @@ export async function handleCheckUpdates(
   logger: Logger,
 ): Promise<ApiResponse> {
   try {
-    const updates = await checkForUpdates();
+    // Serve repeated status requests from the TTL'd update cache instead of
+    // re-probing the npm registry for every package on each call
+    const updates = await checkForUpdates(undefined, { useCache: true });
     return {
       success: true,
       data: updates,
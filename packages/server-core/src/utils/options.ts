@@ -1,8 +1,41 @@
+import { safeStringify } from "@voltagent/internal";
 import { Output } from "ai";
 import { z } from "zod";
 import { convertJsonSchemaToZod } from "zod-from-json-schema";
 import { convertJsonSchemaToZod as convertJsonSchemaToZodV3 } from "zod-from-json-schema-v3";
 
+// The converter depends only on the installed zod major, so pick it once
+const jsonSchemaConverter = "toJSONSchema" in z ? convertJsonSchemaToZod : convertJsonSchemaToZodV3;
+
+const MAX_SCHEMA_CACHE_ENTRIES = 32;
+const zodSchemaCache = new Map<string, unknown>();
+
+/**
+ * Convert a JSON schema from a request body to a Zod schema (supports zod v3
+ * and v4). Clients resend the same schema on every request, so conversions
+ * are memoized by the serialized schema with LRU eviction.
+ */
+export function jsonSchemaToZod(jsonSchema: unknown): any {
+  const cacheKey = safeStringify(jsonSchema);
+  const cached = zodSchemaCache.get(cacheKey);
+  if (cached !== undefined) {
+    // Re-insert to refresh recency (Map preserves insertion order)
+    zodSchemaCache.delete(cacheKey);
+    zodSchemaCache.set(cacheKey, cached);
+    return cached;
+  }
+
+  const converted = jsonSchemaConverter(jsonSchema as any);
+  if (zodSchemaCache.size >= MAX_SCHEMA_CACHE_ENTRIES) {
+    const oldestKey = zodSchemaCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      zodSchemaCache.delete(oldestKey);
+    }
+  }
+  zodSchemaCache.set(cacheKey, converted);
+  return converted;
+}
+
 /**
  * Process agent options from request body
  */
@@ -53,9 +86,7 @@ export function processAgentOptions(body: any, signal?: AbortSignal): ProcessedA
 
     if (type === "object" && jsonSchema) {
       // Convert JSON schema to Zod schema (supports zod v3 and v4)
-      const zodSchema = ("toJSONSchema" in z ? convertJsonSchemaToZod : convertJsonSchemaToZodV3)(
-        jsonSchema,
-      ) as any;
+      const zodSchema = jsonSchemaToZod(jsonSchema);
 
       processedOptions.output = Output.object({ schema: zodSchema });
     } else if (type === "text") {
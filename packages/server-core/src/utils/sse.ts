@@ -13,14 +13,14 @@ import { safeStringify } from "@voltagent/internal";
  * @returns Formatted SSE string
  */
 export function formatSSE(data: any, event?: string, id?: string): string {
-  let message = "";
+  const parts: string[] = [];
 
   if (id) {
-    message += `id: ${id}\n`;
+    parts.push(`id: ${id}\n`);
   }
 
   if (event) {
-    message += `event: ${event}\n`;
+    parts.push(`event: ${event}\n`);
   }
 
   // Handle multiline data
@@ -28,11 +28,11 @@ export function formatSSE(data: any, event?: string, id?: string): string {
   const lines = dataStr.split("\n");
 
   for (const line of lines) {
-    message += `data: ${line}\n`;
+    parts.push(`data: ${line}\n`);
   }
 
-  message += "\n";
-  return message;
+  parts.push("\n");
+  return parts.join("");
 }
 
 /**
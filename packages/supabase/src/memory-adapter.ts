@@ -91,6 +91,7 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
   private client: SupabaseClient;
   private baseTableName: string;
   private initialized = false;
+  private initPromise: Promise<void> | null = null;
   private debug: boolean;
   private logger: Logger;
 
@@ -126,7 +127,7 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
     this.log("Supabase Memory V2 adapter initialized");
 
     // Initialize tables
-    this.initialize().catch((error) => {
+    this.ensureInitialized().catch((error) => {
       this.logger.error("Failed to initialize Supabase Memory V2:", error);
     });
   }
@@ -144,6 +145,10 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
    * Generate a random ID
    */
   private generateId(): string {
+    // Math.random ids are neither unique nor unpredictable; prefer the CSPRNG
+    if (typeof globalThis.crypto?.randomUUID === "function") {
+      return globalThis.crypto.randomUUID();
+    }
     return (
       Math.random().toString(36).substring(2, 15) + Math.random().toString(36).substring(2, 15)
     );
@@ -154,16 +159,12 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
    */
   private async checkFreshInstallation(): Promise<boolean> {
     try {
-      // Check if basic tables exist by trying to select from them
-      const { error: conversationsError } = await this.client
-        .from(`${this.baseTableName}_conversations`)
-        .select("id")
-        .limit(1);
-
-      const { error: messagesError } = await this.client
-        .from(`${this.baseTableName}_messages`)
-        .select("message_id")
-        .limit(1);
+      // Check if basic tables exist by trying to select from them.
+      // The probes are independent REST calls, so issue them concurrently
+      const [{ error: conversationsError }, { error: messagesError }] = await Promise.all([
+        this.client.from(`${this.baseTableName}_conversations`).select("id").limit(1),
+        this.client.from(`${this.baseTableName}_messages`).select("message_id").limit(1),
+      ]);
 
       // If both tables are missing, it's a fresh installation
       return !!conversationsError && !!messagesError;
@@ -177,28 +178,28 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
    */
   private async checkMigrationNeeded(): Promise<boolean> {
     try {
-      // Try to select new V2 columns from messages table
-      const { error: messagesError } = await this.client
-        .from(`${this.baseTableName}_messages`)
-        .select("parts, format_version")
-        .limit(1);
-
-      // Try to select new V2 columns from conversations table
-      const { error: conversationsError } = await this.client
-        .from(`${this.baseTableName}_conversations`)
-        .select("user_id, resource_id")
-        .limit(1);
-
-      // Try to select workflow state event columns (for events persistence feature)
-      const { error: workflowEventsError } = await this.client
-        .from(`${this.baseTableName}_workflow_states`)
-        .select("events, output, cancellation")
-        .limit(1);
-
-      const { error: stepsTableError } = await this.client
-        .from(`${this.baseTableName}_steps`)
-        .select("id")
-        .limit(1);
+      // Probe the V2 columns and tables concurrently; each check is an
+      // independent REST call and only the combined verdict matters
+      const [
+        { error: messagesError },
+        { error: conversationsError },
+        { error: workflowEventsError },
+        { error: stepsTableError },
+      ] = await Promise.all([
+        // New V2 columns on the messages table
+        this.client.from(`${this.baseTableName}_messages`).select("parts, format_version").limit(1),
+        // New V2 columns on the conversations table
+        this.client
+          .from(`${this.baseTableName}_conversations`)
+          .select("user_id, resource_id")
+          .limit(1),
+        // Workflow state event columns (for events persistence feature)
+        this.client
+          .from(`${this.baseTableName}_workflow_states`)
+          .select("events, output, cancellation")
+          .limit(1),
+        this.client.from(`${this.baseTableName}_steps`).select("id").limit(1),
+      ]);
 
       // If any query fails, migration is needed
       return !!messagesError || !!conversationsError || !!workflowEventsError || !!stepsTableError;
@@ -207,6 +208,21 @@ export class SupabaseMemoryAdapter implements StorageAdapter {
     }
   }
 
+  /**
+   * Ensure the schema check runs once; concurrent callers share the same
+   * in-flight promise instead of each re-running the installation probes.
+   * A failed attempt clears the promise so the next call can retry.
+   */
+  private ensureInitialized(): Promise<void> {
+    if (!this.initPromise) {
+      this.initPromise = this.initialize();
+      this.initPromise.catch(() => {
+        this.initPromise = null;
+      });
+    }
+    return this.initPromise;
+  }
+
   /**
    * Initialize database schema
    */
@@ -482,7 +498,7 @@ END OF MIGRATION SQL
    * Add a single message
    */
   async addMessage(message: UIMessage, userId: string, conversationId: string): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const messagesTable = `${this.baseTableName}_messages`;
     const messageId = message.id || this.generateId();
@@ -518,7 +534,7 @@ END OF MIGRATION SQL
    * Add multiple messages
    */
   async addMessages(messages: UIMessage[], userId: string, conversationId: string): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const messagesTable = `${this.baseTableName}_messages`;
 
@@ -556,7 +572,7 @@ END OF MIGRATION SQL
       return;
     }
 
-    await this.initialize();
+    await this.ensureInitialized();
 
     const stepsTable = `${this.baseTableName}_steps`;
     const rows = steps.map((step) => ({
@@ -607,7 +623,7 @@ END OF MIGRATION SQL
     conversationId: string,
     options?: GetMessagesOptions,
   ): Promise<UIMessage<{ createdAt: Date }>[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const messagesTable = `${this.baseTableName}_messages`;
     const { limit, before, after, roles } = options || {};
@@ -704,7 +720,7 @@ END OF MIGRATION SQL
     conversationId: string,
     options?: GetConversationStepsOptions,
   ): Promise<ConversationStepRecord[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const stepsTable = `${this.baseTableName}_steps`;
     let query = this.client
@@ -752,7 +768,7 @@ END OF MIGRATION SQL
    * Clear messages for a user
    */
   async clearMessages(userId: string, conversationId?: string): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const messagesTable = `${this.baseTableName}_messages`;
     const stepsTable = `${this.baseTableName}_steps`;
@@ -826,7 +842,7 @@ END OF MIGRATION SQL
     userId: string,
     conversationId: string,
   ): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     if (messageIds.length === 0) {
       return;
@@ -853,7 +869,7 @@ END OF MIGRATION SQL
    * Create a new conversation
    */
   async createConversation(input: CreateConversationInput): Promise<Conversation> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
 
@@ -898,7 +914,7 @@ END OF MIGRATION SQL
    * Get a conversation by ID
    */
   async getConversation(id: string): Promise<Conversation | null> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
 
@@ -935,7 +951,7 @@ END OF MIGRATION SQL
    * Get conversations by resource ID
    */
   async getConversations(resourceId: string): Promise<Conversation[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
 
@@ -974,7 +990,7 @@ END OF MIGRATION SQL
    * Query conversations with filters
    */
   async queryConversations(options: ConversationQueryOptions): Promise<Conversation[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
     let query = this.client.from(conversationsTable).select("*");
@@ -1023,7 +1039,7 @@ END OF MIGRATION SQL
    * Count conversations with filters
    */
   async countConversations(options: ConversationQueryOptions): Promise<number> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
     let query = this.client.from(conversationsTable).select("id", { count: "exact", head: true });
@@ -1052,7 +1068,7 @@ END OF MIGRATION SQL
     id: string,
     updates: Partial<Omit<Conversation, "id" | "createdAt" | "updatedAt">>,
   ): Promise<Conversation> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
     const conversation = await this.getConversation(id);
@@ -1101,7 +1117,7 @@ END OF MIGRATION SQL
    * Delete a conversation
    */
   async deleteConversation(id: string): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const conversationsTable = `${this.baseTableName}_conversations`;
 
@@ -1126,7 +1142,7 @@ END OF MIGRATION SQL
     userId?: string;
     scope: WorkingMemoryScope;
   }): Promise<string | null> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     if (params.scope === "conversation" && params.conversationId) {
       const conversation = await this.getConversation(params.conversationId);
@@ -1164,7 +1180,7 @@ END OF MIGRATION SQL
     content: string;
     scope: WorkingMemoryScope;
   }): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     if (params.scope === "conversation" && params.conversationId) {
       const conversation = await this.getConversation(params.conversationId);
@@ -1230,7 +1246,7 @@ END OF MIGRATION SQL
     userId?: string;
     scope: WorkingMemoryScope;
   }): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     if (params.scope === "conversation" && params.conversationId) {
       const conversation = await this.getConversation(params.conversationId);
@@ -1281,7 +1297,7 @@ END OF MIGRATION SQL
    * Get workflow state by execution ID
    */
   async getWorkflowState(executionId: string): Promise<WorkflowStateEntry | null> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const workflowStatesTable = `${this.baseTableName}_workflow_states`;
     const { data, error } = await this.client
@@ -1323,7 +1339,7 @@ END OF MIGRATION SQL
    * Query workflow states with optional filters
    */
   async queryWorkflowRuns(query: WorkflowRunQuery): Promise<WorkflowStateEntry[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const workflowStatesTable = `${this.baseTableName}_workflow_states`;
     let queryBuilder = this.client.from(workflowStatesTable).select("*");
@@ -1391,7 +1407,7 @@ END OF MIGRATION SQL
    * Set workflow state
    */
   async setWorkflowState(executionId: string, state: WorkflowStateEntry): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const workflowStatesTable = `${this.baseTableName}_workflow_states`;
 
@@ -1423,7 +1439,7 @@ END OF MIGRATION SQL
     executionId: string,
     updates: Partial<WorkflowStateEntry>,
   ): Promise<void> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const existing = await this.getWorkflowState(executionId);
     if (!existing) {
@@ -1443,7 +1459,7 @@ END OF MIGRATION SQL
    * Get suspended workflow states for a workflow
    */
   async getSuspendedWorkflowStates(workflowId: string): Promise<WorkflowStateEntry[]> {
-    await this.initialize();
+    await this.ensureInitialized();
 
     const workflowStatesTable = `${this.baseTableName}_workflow_states`;
     const { data, error } = await this.client
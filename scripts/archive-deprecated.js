@@ -8,7 +8,6 @@
 
 const fs = require("node:fs");
 const path = require("node:path");
-const { execSync } = require("node:child_process");
 
 const DEPRECATED_PACKAGES = [
   "@voltagent/anthropic-ai",
@@ -73,11 +72,11 @@ These packages are still available on NPM for backward compatibility, but will n
       console.log(`📦 Archiving ${packageName}...`);
 
       // Copy package to archive
-      execSync(`cp -r "${sourcePath}" "${targetPath}"`, { stdio: "pipe" });
+      fs.cpSync(sourcePath, targetPath, { recursive: true });
       console.log("  ✅ Copied to archive");
 
       // Remove from main packages directory
-      execSync(`rm -rf "${sourcePath}"`, { stdio: "pipe" });
+      fs.rmSync(sourcePath, { recursive: true, force: true });
       console.log("  ✅ Removed from packages/");
 
       console.log(`  ✅ ${packageName} archived successfully\n`);
@@ -1,6 +1,7 @@
 #!/usr/bin/env node
 
 const fs = require("node:fs");
+const fsp = require("node:fs/promises");
 const path = require("node:path");
 
 const repoRoot = path.resolve(__dirname, "..");
@@ -70,31 +71,36 @@ const sources = [
   },
 ];
 
-const copyDir = (source, destination) => {
+const copyDir = async (source, destination) => {
   if (!fs.existsSync(source)) {
     console.warn(`Skipping missing source: ${source}`);
     return;
   }
 
-  fs.mkdirSync(path.dirname(destination), { recursive: true });
-  fs.cpSync(source, destination, { recursive: true });
+  await fsp.mkdir(path.dirname(destination), { recursive: true });
+  await fsp.cp(source, destination, { recursive: true });
 };
 
-const syncTarget = (target) => {
+const syncTarget = async (target) => {
   if (fs.existsSync(target.root)) {
-    fs.rmSync(target.root, { recursive: true, force: true });
+    await fsp.rm(target.root, { recursive: true, force: true });
   }
 
-  fs.mkdirSync(target.root, { recursive: true });
+  await fsp.mkdir(target.root, { recursive: true });
 
-  for (const entry of sources) {
-    const destPath = path.join(target.root, entry.dest);
-    copyDir(entry.src, destPath);
-  }
+  // The source trees land in distinct destinations, so copy them concurrently
+  await Promise.all(
+    sources.map((entry) => copyDir(entry.src, path.join(target.root, entry.dest))),
+  );
 
   console.log(`Synced docs into ${target.label}: ${target.root}`);
 };
 
-for (const target of targets) {
-  syncTarget(target);
-}
+(async () => {
+  for (const target of targets) {
+    await syncTarget(target);
+  }
+})().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});